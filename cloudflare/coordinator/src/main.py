@@ -2,100 +2,274 @@
 Cloudflare Coordinator Worker
 Manages distributed job queue for Six Worker loaders
 """
-from js import Response, Headers, Date
+from js import Response, Headers, Date, Uint8Array, crypto
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is not bundled with every Python Workers runtime
+    orjson = None
+
 # Worker environment will provide these bindings
-# - env.HYPERDRIVE: Database connection (read-only)
+# - env.HYPERDRIVE: Database connection (read-only, except atomic job claims)
+#   JSONB columns (config, checkpoint, capabilities) come back already decoded
 # - env.JOB_QUEUE: Cloudflare Queue for job submissions
+# - env.HEARTBEAT_QUEUE: Cloudflare Queue for worker heartbeats
 # - env.AWS_REGION: AWS region
 # - env.AWS_ACCESS_KEY_ID: CloudWatch access key (secret)
 # - env.AWS_SECRET_ACCESS_KEY: CloudWatch secret key (secret)
 
-async def on_fetch(request, env):
-    """Main request handler"""
-    url = request.url
-    method = request.method
+# CORS headers for browser access (built once per isolate, reused by every response)
+CORS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Content-Type': 'application/json'
+}
+CORS_HEADERS = Headers.new(CORS)
 
-    # Parse URL
-    from urllib.parse import urlparse
-    parsed = urlparse(url)
-    path = parsed.path
-
-    # CORS headers for browser access
-    cors_headers = {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
-        'Content-Type': 'application/json'
-    }
+# Dashboard list endpoints are polled frequently; let the edge cache coalesce polls
+LIST_CACHE_CONTROL = 'public, max-age=5, stale-while-revalidate=30'
+LIST_HEADERS = Headers.new({**CORS, 'Cache-Control': LIST_CACHE_CONTROL})
 
-    # Handle OPTIONS (preflight)
-    if method == 'OPTIONS':
-        return Response.new(None, status=204, headers=Headers.new(cors_headers))
+# Allowed page sizes for list endpoints (keeps the cache key space bounded)
+LIST_LIMITS = (10, 50, 100)
 
+
+def clamp_limit(value, default):
+    """Snap a requested ?limit= to the smallest allowed page size that covers it"""
     try:
-        # Route handling
-        if path == '/health':
-            return handle_health(env, cors_headers)
+        requested = int(value)
+    except (TypeError, ValueError):
+        return default
+    for allowed in LIST_LIMITS:
+        if requested <= allowed:
+            return allowed
+    return LIST_LIMITS[-1]
+
+
+def split_url(url):
+    """Split a request URL into (path, query) without urllib"""
+    start = url.find('/', url.find('//') + 2) if '//' in url else 0
+    if start < 0:
+        return '/', ''
+    path, _, query = url[start:].partition('?')
+    return path, query
+
+
+def parse_query(query):
+    """
+    Parse a query string into a dict of first values.
+
+    Query values used by this API are plain tokens (statuses, integers),
+    so no percent-decoding is performed.
+    """
+    params = {}
+    for pair in query.split('&'):
+        if pair:
+            key, _, value = pair.partition('=')
+            params.setdefault(key, value)
+    return params
+
+
+def _json_default(value):
+    """Serialize datetimes the way orjson does (ISO 8601)"""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(data):
+    """
+    Compact JSON response body as a str; datetimes are emitted as ISO 8601.
+
+    Always a str: Pyodide converts str implicitly when passed to
+    Response.new(), but bytes would cross into JS as a PyProxy.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'), default=_json_default)
+
+
+# SQL statements, built once per isolate. Hyperdrive does not support named
+# prepared statements, so these are sent as unnamed statements per request.
+# Timestamps are formatted as ISO 8601 by Postgres (to_char of NULL is NULL).
+
+ISO_TS = 'YYYY-MM-DD"T"HH24:MI:SS.US'
+
+CLAIM_JOB_SQL = f"""
+    UPDATE job_queue
+    SET status = 'claimed', worker_id = $1, claimed_at = NOW(), updated_at = NOW()
+    WHERE job_id = (
+        SELECT job_id
+        FROM job_queue
+        WHERE status = 'pending'
+        AND job_type = ANY($2)
+        ORDER BY created_at ASC
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING job_id, job_type, config, to_char(created_at, '{ISO_TS}') AS created_at
+"""
+
+JOB_STATUS_SQL = f"""
+    SELECT jsonb_build_object(
+        'job_id', j.job_id,
+        'job_type', j.job_type,
+        'status', j.status,
+        'worker_id', j.worker_id,
+        'checkpoint', j.checkpoint,
+        'created_at', to_char(j.created_at, '{ISO_TS}'),
+        'claimed_at', to_char(j.claimed_at, '{ISO_TS}'),
+        'started_at', to_char(j.started_at, '{ISO_TS}'),
+        'completed_at', to_char(j.completed_at, '{ISO_TS}'),
+        'error_message', j.error_message,
+        'worker', CASE WHEN w.hostname IS NOT NULL THEN jsonb_build_object(
+            'hostname', w.hostname,
+            'last_heartbeat', to_char(w.last_heartbeat, '{ISO_TS}')
+        ) END
+    ) AS doc
+    FROM job_queue j
+    LEFT JOIN workers w ON j.worker_id = w.worker_id
+    WHERE j.job_id = $1
+"""
+
+LIST_WORKERS_SQL = f"""
+    SELECT worker_id, hostname, status, to_char(last_heartbeat, '{ISO_TS}') AS last_heartbeat, capabilities
+    FROM workers
+    WHERE status IN ('active', 'idle')
+    ORDER BY workers.last_heartbeat DESC
+"""
+
+# Only the columns rendered by the list endpoint; config/checkpoint can be large
+LIST_JOBS_SQL = f"""
+    SELECT job_id, job_type, status, worker_id, to_char(created_at, '{ISO_TS}') AS created_at
+    FROM job_queue
+    ORDER BY job_queue.created_at DESC
+    LIMIT $1
+"""
+
+LIST_JOBS_BY_STATUS_SQL = f"""
+    SELECT job_id, job_type, status, worker_id, to_char(created_at, '{ISO_TS}') AS created_at
+    FROM job_queue
+    WHERE status = $1
+    ORDER BY job_queue.created_at DESC
+    LIMIT $2
+"""
+
+LIST_DQ_ISSUES_SQL = f"""
+    SELECT
+        issue_id, job_id, source_record_id, issue_type, severity,
+        field_name, invalid_value, expected_format, message,
+        resolution_status, to_char(created_at, '{ISO_TS}') AS created_at
+    FROM data_quality_issues
+    WHERE resolution_status = $1
+    ORDER BY data_quality_issues.created_at DESC
+    LIMIT $2
+"""
+
+# Static health check body (a Response itself can't be shared: its body is single-use).
+# Kept as a str so it converts to a JS string on every Response.new()
+HEALTH_BODY = str(dumps({
+    'status': 'healthy',
+    'service': 'lexara-coordinator',
+    'timestamp': 'ok'
+}))
+
+# Crockford's Base32
+ULID_ALPHABET = b'0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+
+# Bodies up to this size are read in one call; larger ones are streamed
+SMALL_BODY_BYTES = 2500
+
 
-        elif path == '/jobs/claim' and method == 'POST':
-            body = await request.json()
-            return await handle_claim_job(body, env, cors_headers)
+async def read_json(request):
+    """
+    Parse a JSON request body with a single Python-side json.loads.
+
+    Avoids Response.json()'s JS object -> Python conversion. Large bodies are
+    drained chunk by chunk from the body stream into one bytearray.
+    """
+    content_length = request.headers.get('Content-Length')
+    if content_length is not None and int(content_length) <= SMALL_BODY_BYTES:
+        text = await request.text()
+        return json.loads(text) if text else {}
 
-        elif path == '/jobs/submit' and method == 'POST':
-            body = await request.json()
-            return await handle_submit_job(body, env, cors_headers)
+    if request.body is None:
+        return {}
 
-        elif path.startswith('/jobs/') and path.endswith('/status') and method == 'GET':
-            job_id = path.split('/')[2]
-            return await handle_job_status(job_id, env, cors_headers)
+    buf = bytearray()
+    reader = request.body.getReader()
+    while True:
+        chunk = await reader.read()
+        if chunk.done:
+            break
+        buf.extend(chunk.value.to_bytes())
 
-        elif path.startswith('/jobs/') and path.endswith('/heartbeat') and method == 'POST':
-            job_id = path.split('/')[2]
-            body = await request.json()
-            return await handle_heartbeat(job_id, body, env, cors_headers)
+    return json.loads(buf) if buf else {}
 
-        elif path == '/jobs' and method == 'GET':
-            return await handle_list_jobs(request, env, cors_headers)
 
-        elif path == '/workers' and method == 'GET':
-            return await handle_list_workers(env, cors_headers)
+async def on_fetch(request, env):
+    """Main request handler"""
+    url = request.url
+    method = request.method
 
-        elif path == '/data-quality/issues' and method == 'GET':
-            return await handle_list_dq_issues(request, env, cors_headers)
+    # Health checks are the most frequent request; answer before any parsing
+    if method == 'GET' and url.endswith('/health'):
+        return Response.new(HEALTH_BODY, status=200, headers=CORS_HEADERS)
 
-        else:
-            return Response.new(
-                json.dumps({'error': 'Not found'}),
-                status=404,
-                headers=Headers.new(cors_headers)
-            )
+    # Parse URL
+    path, _ = split_url(url)
+
+    # Handle OPTIONS (preflight)
+    if method == 'OPTIONS':
+        return Response.new(None, status=204, headers=CORS_HEADERS)
+
+    try:
+        # Exact-match routes
+        route = ROUTES.get((method, path))
+        if route:
+            handler, arg = route
+            if arg == 'body':
+                return await handler(await read_json(request), env)
+            if arg == 'request':
+                return await handler(request, env)
+            return await handler(env)
+
+        # Parameterized routes: /jobs/{job_id}/{action}
+        parts = path.split('/')
+        if len(parts) == 4 and parts[1] == 'jobs':
+            route = JOB_ROUTES.get((method, parts[3]))
+            if route:
+                handler, arg = route
+                if arg == 'body':
+                    return await handler(parts[2], await read_json(request), env)
+                return await handler(parts[2], env)
+
+        return Response.new(
+            dumps({'error': 'Not found'}),
+            status=404,
+            headers=CORS_HEADERS
+        )
 
     except Exception as e:
         return Response.new(
-            json.dumps({'error': str(e)}),
+            dumps({'error': str(e)}),
             status=500,
-            headers=Headers.new(cors_headers)
+            headers=CORS_HEADERS
         )
 
 
-def handle_health(env, headers_dict):
+async def handle_health(env):
     """Health check endpoint"""
-    response_body = json.dumps({
-        'status': 'healthy',
-        'service': 'lexara-coordinator',
-        'timestamp': 'ok'
-    })
-
     return Response.new(
-        response_body,
+        HEALTH_BODY,
         status=200,
-        headers=headers_dict
+        headers=CORS_HEADERS
     )
 
 
-async def handle_claim_job(body, env, headers):
+async def handle_claim_job(body, env):
     """
     Worker claims a job from the queue
 
@@ -110,64 +284,47 @@ async def handle_claim_job(body, env, headers):
         "job_id": "01K6...",
         "job_type": "iowa_business",
         "config": {...},
-        "claim_instruction": {
-            "sql": "UPDATE job_queue SET...",
-            "params": [...]
-        }
+        "created_at": "..."
     }
+
+    The job is claimed atomically in a single UPDATE ... FOR UPDATE SKIP LOCKED
+    statement, so the worker no longer needs to run any claim SQL against Aurora.
     """
     worker_id = body.get('worker_id')
     capabilities = body.get('capabilities', [])
 
     if not worker_id:
         return Response.new(
-            json.dumps({'error': 'worker_id required'}),
+            dumps({'error': 'worker_id required'}),
             status=400,
-            headers=Headers.new(headers)
+            headers=CORS_HEADERS
         )
 
-    # Query Hyperdrive for pending jobs
-    # Note: Hyperdrive binding provides a D1-like API
-    result = await env.HYPERDRIVE.prepare("""
-        SELECT job_id, job_type, config, created_at
-        FROM job_queue
-        WHERE status = 'pending'
-        AND job_type = ANY($1)
-        ORDER BY created_at ASC
-        LIMIT 1
-    """).bind([capabilities]).first()
+    # Claim the oldest matching pending job in one statement. SKIP LOCKED lets
+    # concurrent claimers pass over rows another worker is claiming instead of
+    # blocking on (or racing for) the same job. Being an UPDATE, Hyperdrive
+    # treats it as mutating and never serves it from its query cache.
+    result = await env.HYPERDRIVE.prepare(CLAIM_JOB_SQL).bind([worker_id, capabilities]).first()
 
     if not result:
         # No jobs available
-        return Response.new(None, status=204, headers=Headers.new(headers))
+        return Response.new(None, status=204, headers=CORS_HEADERS)
 
-    # Return job with claim instruction
     response_data = {
         'job_id': result['job_id'],
         'job_type': result['job_type'],
-        'config': json.loads(result['config']) if isinstance(result['config'], str) else result['config'],
-        'created_at': result['created_at'].isoformat() if hasattr(result['created_at'], 'isoformat') else str(result['created_at']),
-
-        # Tell worker how to claim in Aurora
-        'claim_instruction': {
-            'sql': """
-                UPDATE job_queue
-                SET status = 'claimed', worker_id = $1, claimed_at = NOW(), updated_at = NOW()
-                WHERE job_id = $2 AND status = 'pending'
-                RETURNING *
-            """,
-            'params': [worker_id, result['job_id']]
-        }
+        'config': result['config'],
+        'created_at': result['created_at']
     }
 
     return Response.new(
-        json.dumps(response_data),
+        dumps(response_data),
         status=200,
-        headers=Headers.new(headers)
+        headers=CORS_HEADERS
     )
 
 
-async def handle_submit_job(body, env, headers):
+async def handle_submit_job(body, env):
     """
     Submit a new job to the queue
 
@@ -182,9 +339,9 @@ async def handle_submit_job(body, env, headers):
 
     if not job_type:
         return Response.new(
-            json.dumps({'error': 'job_type required'}),
+            dumps({'error': 'job_type required'}),
             status=400,
-            headers=Headers.new(headers)
+            headers=CORS_HEADERS
         )
 
     # Generate ULID for job
@@ -199,103 +356,91 @@ async def handle_submit_job(body, env, headers):
     })
 
     return Response.new(
-        json.dumps({
+        dumps({
             'job_id': job_id,
             'status': 'queued',
             'message': 'Job submitted successfully'
         }),
         status=202,
-        headers=Headers.new(headers)
+        headers=CORS_HEADERS
     )
 
 
-async def handle_job_status(job_id, env, headers):
-    """Get job status from Hyperdrive"""
-    result = await env.HYPERDRIVE.prepare("""
-        SELECT
-            j.job_id,
-            j.job_type,
-            j.status,
-            j.worker_id,
-            j.checkpoint,
-            j.created_at,
-            j.claimed_at,
-            j.started_at,
-            j.completed_at,
-            j.error_message,
-            w.hostname,
-            w.last_heartbeat
-        FROM job_queue j
-        LEFT JOIN workers w ON j.worker_id = w.worker_id
-        WHERE j.job_id = $1
-    """).bind([job_id]).first()
+async def handle_job_status(job_id, env):
+    """
+    Get job status from Hyperdrive
+
+    Postgres builds the whole response document (including the nested
+    worker object and ISO 8601 timestamps), so no per-field Python work is needed.
+    """
+    result = await env.HYPERDRIVE.prepare(JOB_STATUS_SQL).bind([job_id]).first()
 
     if not result:
         return Response.new(
-            json.dumps({'error': 'Job not found'}),
+            dumps({'error': 'Job not found'}),
             status=404,
-            headers=Headers.new(headers)
+            headers=CORS_HEADERS
         )
 
-    # Convert to JSON-serializable format
-    job_data = {
-        'job_id': result['job_id'],
-        'job_type': result['job_type'],
-        'status': result['status'],
-        'worker_id': result['worker_id'],
-        'checkpoint': json.loads(result['checkpoint']) if result['checkpoint'] else None,
-        'created_at': str(result['created_at']),
-        'claimed_at': str(result['claimed_at']) if result['claimed_at'] else None,
-        'started_at': str(result['started_at']) if result['started_at'] else None,
-        'completed_at': str(result['completed_at']) if result['completed_at'] else None,
-        'error_message': result['error_message'],
-        'worker': {
-            'hostname': result['hostname'],
-            'last_heartbeat': str(result['last_heartbeat']) if result['last_heartbeat'] else None
-        } if result['hostname'] else None
-    }
+    doc = result['doc']
 
     return Response.new(
-        json.dumps(job_data),
+        doc if isinstance(doc, str) else dumps(doc),
         status=200,
-        headers=Headers.new(headers)
+        headers=CORS_HEADERS
     )
 
 
-async def handle_heartbeat(job_id, body, env, headers):
+async def handle_heartbeat(job_id, body, env):
     """
     Receive heartbeat from worker
-    Note: Worker updates Aurora directly, this is just for logging
+
+    Heartbeats are buffered through HEARTBEAT_QUEUE rather than written to
+    Postgres per request; the queue consumer applies each batch with a single
+    UPDATE of workers.last_heartbeat.
     """
     worker_id = body.get('worker_id')
     metadata = body.get('metadata', {})
 
-    # Log heartbeat (could send to CloudWatch here)
-    # For now, just acknowledge
+    if not worker_id:
+        return Response.new(
+            dumps({'error': 'worker_id required'}),
+            status=400,
+            headers=CORS_HEADERS
+        )
+
+    await env.HEARTBEAT_QUEUE.send({
+        'worker_id': worker_id,
+        'job_id': job_id,
+        'ts': Date.new().toISOString(),
+        'metadata': metadata
+    })
 
     return Response.new(
-        json.dumps({'status': 'acknowledged'}),
+        dumps({'status': 'acknowledged'}),
         status=200,
-        headers=Headers.new(headers)
+        headers=CORS_HEADERS
     )
 
 
-async def handle_list_jobs(request, env, headers):
-    """List jobs with filtering"""
-    from urllib.parse import urlparse, parse_qs
+async def handle_list_jobs(request, env):
+    """
+    List jobs with filtering
 
-    parsed = urlparse(request.url)
-    params = parse_qs(parsed.query)
+    List queries are plain SELECTs (no SET/BEGIN) so Hyperdrive can serve
+    them from its query cache; responses are edge-cacheable for a few seconds.
+    """
+    _, query_string = split_url(request.url)
+    params = parse_query(query_string)
 
-    status_filter = params.get('status', ['all'])[0]
-    limit = int(params.get('limit', ['50'])[0])
+    status_filter = params.get('status', 'all')
+    limit = clamp_limit(params.get('limit'), 50)
 
-    # Build query
     if status_filter == 'all':
-        query = "SELECT * FROM job_queue ORDER BY created_at DESC LIMIT $1"
+        query = LIST_JOBS_SQL
         bind_params = [limit]
     else:
-        query = "SELECT * FROM job_queue WHERE status = $1 ORDER BY created_at DESC LIMIT $2"
+        query = LIST_JOBS_BY_STATUS_SQL
         bind_params = [status_filter, limit]
 
     results = await env.HYPERDRIVE.prepare(query).bind(bind_params).all()
@@ -306,65 +451,49 @@ async def handle_list_jobs(request, env, headers):
             'job_type': r['job_type'],
             'status': r['status'],
             'worker_id': r['worker_id'],
-            'created_at': str(r['created_at'])
+            'created_at': r['created_at']
         }
         for r in results['results']
     ]
 
     return Response.new(
-        json.dumps({'jobs': jobs, 'count': len(jobs)}),
+        dumps({'jobs': jobs, 'count': len(jobs)}),
         status=200,
-        headers=Headers.new(headers)
+        headers=LIST_HEADERS
     )
 
 
-async def handle_list_workers(env, headers):
+async def handle_list_workers(env):
     """List active workers"""
-    results = await env.HYPERDRIVE.prepare("""
-        SELECT worker_id, hostname, status, last_heartbeat, capabilities
-        FROM workers
-        WHERE status IN ('active', 'idle')
-        ORDER BY last_heartbeat DESC
-    """).all()
+    results = await env.HYPERDRIVE.prepare(LIST_WORKERS_SQL).all()
 
     workers = [
         {
             'worker_id': r['worker_id'],
             'hostname': r['hostname'],
             'status': r['status'],
-            'last_heartbeat': str(r['last_heartbeat']),
-            'capabilities': json.loads(r['capabilities']) if isinstance(r['capabilities'], str) else r['capabilities']
+            'last_heartbeat': r['last_heartbeat'],
+            'capabilities': r['capabilities']
         }
         for r in results['results']
     ]
 
     return Response.new(
-        json.dumps({'workers': workers, 'count': len(workers)}),
+        dumps({'workers': workers, 'count': len(workers)}),
         status=200,
-        headers=Headers.new(headers)
+        headers=LIST_HEADERS
     )
 
 
-async def handle_list_dq_issues(request, env, headers):
+async def handle_list_dq_issues(request, env):
     """List data quality issues"""
-    from urllib.parse import urlparse, parse_qs
-
-    parsed = urlparse(request.url)
-    params = parse_qs(parsed.query)
+    _, query_string = split_url(request.url)
+    params = parse_query(query_string)
 
-    status_filter = params.get('status', ['pending'])[0]
-    limit = int(params.get('limit', ['100'])[0])
+    status_filter = params.get('status', 'pending')
+    limit = clamp_limit(params.get('limit'), 100)
 
-    results = await env.HYPERDRIVE.prepare("""
-        SELECT
-            issue_id, job_id, source_record_id, issue_type, severity,
-            field_name, invalid_value, expected_format, message,
-            resolution_status, created_at
-        FROM data_quality_issues
-        WHERE resolution_status = $1
-        ORDER BY created_at DESC
-        LIMIT $2
-    """).bind([status_filter, limit]).all()
+    results = await env.HYPERDRIVE.prepare(LIST_DQ_ISSUES_SQL).bind([status_filter, limit]).all()
 
     issues = [
         {
@@ -378,41 +507,56 @@ async def handle_list_dq_issues(request, env, headers):
             'expected_format': r['expected_format'],
             'message': r['message'],
             'resolution_status': r['resolution_status'],
-            'created_at': str(r['created_at'])
+            'created_at': r['created_at']
         }
         for r in results['results']
     ]
 
     return Response.new(
-        json.dumps({'issues': issues, 'count': len(issues)}),
+        dumps({'issues': issues, 'count': len(issues)}),
         status=200,
-        headers=Headers.new(headers)
+        headers=LIST_HEADERS
     )
 
 
 def generate_ulid():
     """Generate ULID (Universally Unique Lexicographically Sortable Identifier)"""
-    import time
-    import random
-
     # ULID format: 01ARYZ6S41 (10 chars timestamp) + TST3QV (16 chars randomness)
-    # Simplified version for Cloudflare Workers
-    timestamp = int(time.time() * 1000)
-
-    # Crockford's Base32
-    alphabet = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
-
-    # Encode timestamp
-    ts_str = ''
-    ts = timestamp
-    for _ in range(10):
-        ts_str = alphabet[ts % 32] + ts_str
-        ts //= 32
-
-    # Add randomness
-    random_str = ''.join(random.choice(alphabet) for _ in range(16))
+    # Time and randomness come from the JS runtime: Date.now() and Web Crypto
+    ts = int(Date.now())
+    rand_bytes = crypto.getRandomValues(Uint8Array.new(10)).to_bytes()
+    out = bytearray(26)
+
+    # Encode 48-bit timestamp into the first 10 chars, right to left
+    for i in range(9, -1, -1):
+        out[i] = ULID_ALPHABET[ts & 31]
+        ts >>= 5
+
+    # Encode 80 random bits into the last 16 chars
+    rand = int.from_bytes(rand_bytes, 'big')
+    for i in range(25, 9, -1):
+        out[i] = ULID_ALPHABET[rand & 31]
+        rand >>= 5
+
+    return out.decode('ascii')
+
+
+# Route tables: handler plus the argument it takes before env
+# ('body' = parsed JSON body, 'request' = raw request, None = env only)
+ROUTES = {
+    ('GET', '/health'): (handle_health, None),
+    ('POST', '/jobs/claim'): (handle_claim_job, 'body'),
+    ('POST', '/jobs/submit'): (handle_submit_job, 'body'),
+    ('GET', '/jobs'): (handle_list_jobs, 'request'),
+    ('GET', '/workers'): (handle_list_workers, None),
+    ('GET', '/data-quality/issues'): (handle_list_dq_issues, 'request'),
+}
 
-    return ts_str + random_str
+# /jobs/{job_id}/{action}
+JOB_ROUTES = {
+    ('GET', 'status'): (handle_job_status, None),
+    ('POST', 'heartbeat'): (handle_heartbeat, 'body'),
+}
 
 
 # Export handler
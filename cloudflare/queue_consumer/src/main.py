@@ -2,11 +2,23 @@
 Cloudflare Queue Consumer Worker
 Receives job submissions and writes them to Aurora PostgreSQL
 """
+import asyncio
 import json
 from datetime import datetime
 
 # This worker consumes messages from Cloudflare Queue
 # and writes them directly to Aurora PostgreSQL
+#
+# Queues consumed:
+# - job-queue-*: job submissions -> INSERT INTO job_queue
+# - heartbeat-queue-*: worker heartbeats -> batched UPDATE of workers.last_heartbeat
+
+HEARTBEAT_QUEUE_PREFIX = 'heartbeat-queue'
+
+# Aurora connection shared by every batch handled in this isolate
+_CONN = None
+_CONN_LOCK = asyncio.Lock()
+
 
 async def on_queue(batch, env):
     """
@@ -16,76 +28,191 @@ async def on_queue(batch, env):
         batch: MessageBatch from Cloudflare Queue
         env: Worker environment with bindings
     """
-    # Get database credentials from Secrets Manager
-    db_creds = await get_aurora_credentials(env)
-
-    # Import psycopg (PostgreSQL driver for Python)
-    # Note: Availability depends on Cloudflare Python Workers support
-    import psycopg
-
-    # Connect to Aurora (direct write connection)
-    async with psycopg.AsyncConnection.connect(
-        host=db_creds['host'],
-        dbname=db_creds['database'],
-        user=db_creds['user'],
-        password=db_creds['password'],
-        port=db_creds['port']
-    ) as conn:
+    messages = list(batch.messages)
+    if not messages:
+        return
+
+    global _CONN
+
+    try:
+        conn = await get_connection(env)
+    except Exception as e:
+        await log_to_cloudwatch(env, {
+            'level': 'ERROR',
+            'message': f'Failed to connect to Aurora: {str(e)}',
+            'error': str(e)
+        })
+        for message in messages:
+            message.retry()
+        return
+
+    try:
+        if batch.queue.startswith(HEARTBEAT_QUEUE_PREFIX):
+            await process_heartbeats(messages, conn, env)
+        else:
+            await process_jobs(messages, conn, env)
+    finally:
+        # Drop a connection that broke mid-batch so the next batch reconnects
+        if conn.closed or conn.broken:
+            _CONN = None
+
+
+async def get_connection(env):
+    """
+    Return the isolate's shared Aurora connection, connecting on first use.
+
+    Warm isolates reuse the connection across batches instead of paying
+    TCP + TLS + auth on every invocation.
+    """
+    global _CONN
+
+    async with _CONN_LOCK:
+        if _CONN is None or _CONN.closed:
+            # Get database credentials from Secrets Manager
+            db_creds = await get_aurora_credentials(env)
+
+            # Import psycopg (PostgreSQL driver for Python)
+            # Note: Availability depends on Cloudflare Python Workers support
+            import psycopg
+
+            # Connect to Aurora (direct write connection)
+            _CONN = await psycopg.AsyncConnection.connect(
+                host=db_creds['host'],
+                dbname=db_creds['database'],
+                user=db_creds['user'],
+                password=db_creds['password'],
+                port=db_creds['port'],
+                autocommit=False
+            )
+
+    return _CONN
+
+
+async def process_jobs(messages, conn, env):
+    """Insert a batch of job submissions with one statement and one commit"""
+    # Validate each message on its own: a malformed one is retried alone
+    # (and dead-lettered after max_retries) instead of failing the batch
+    valid = []
+    rows = []
+    for message in messages:
+        job_data = None  # never log a previous message's body if .body raises
+        try:
+            job_data = message.body
+            rows.append((
+                job_data['job_id'],
+                job_data['job_type'],
+                json.dumps(job_data['config'])
+            ))
+            valid.append(message)
+        except Exception as e:
+            await log_to_cloudwatch(env, {
+                'level': 'ERROR',
+                'message': f'Failed to process queue message: {str(e)}',
+                'job_id': job_data.get('job_id', 'unknown') if isinstance(job_data, dict) else 'unknown',
+                'error': str(e)
+            })
+            message.retry()
+
+    if not rows:
+        return
+    messages = valid
+
+    try:
+        values_sql = ', '.join(["(%s, %s, %s, 'pending', NOW(), NOW())"] * len(rows))
+        params = [value for row in rows for value in row]
+
+        async with conn.cursor() as cur:
+            await cur.execute(f"""
+                INSERT INTO job_queue (
+                    job_id,
+                    job_type,
+                    config,
+                    status,
+                    created_at,
+                    updated_at
+                ) VALUES {values_sql}
+                ON CONFLICT (job_id) DO NOTHING
+                RETURNING job_id
+            """, params)
+            inserted = {row[0] for row in await cur.fetchall()}
+
+        await conn.commit()
+
+    except Exception as e:
+        await conn.rollback()
+
+        # Log error
+        await log_to_cloudwatch(env, {
+            'level': 'ERROR',
+            'message': f'Failed to process queue batch: {str(e)}',
+            'job_ids': [row[0] for row in rows],
+            'error': str(e)
+        })
+
+        # Retry every message in the batch (don't ack)
+        for message in messages:
+            message.retry()
+        return
+
+    # Committed: ack everything. Rows missing from RETURNING already
+    # existed (ON CONFLICT), so they are acked as duplicates.
+    for message, (job_id, job_type, _) in zip(messages, rows):
+        message.ack()
+
+        # Log success
+        await log_to_cloudwatch(env, {
+            'level': 'INFO',
+            'message': 'Job created in queue' if job_id in inserted else 'Job already in queue',
+            'job_id': job_id,
+            'job_type': job_type
+        })
+
+
+async def process_heartbeats(messages, conn, env):
+    """Apply a batch of worker heartbeats with one UPDATE and one commit"""
+    # Keep only the latest heartbeat per worker (ISO 8601 strings sort by time)
+    latest = {}
+    for message in messages:
+        worker_id = message.body.get('worker_id')
+        ts = message.body.get('ts')
+        if worker_id and ts and ts > latest.get(worker_id, ''):
+            latest[worker_id] = ts
+
+    if not latest:
+        for message in messages:
+            message.ack()
+        return
+
+    try:
+        values_sql = ', '.join(['(%s, %s::timestamp)'] * len(latest))
+        params = [value for item in latest.items() for value in item]
+
         async with conn.cursor() as cur:
-            # Process each message in batch
-            for message in batch.messages:
-                try:
-                    job_data = message.body
-
-                    # Insert job into Aurora
-                    await cur.execute("""
-                        INSERT INTO job_queue (
-                            job_id,
-                            job_type,
-                            config,
-                            status,
-                            created_at,
-                            updated_at
-                        ) VALUES (
-                            %(job_id)s,
-                            %(job_type)s,
-                            %(config)s,
-                            'pending',
-                            NOW(),
-                            NOW()
-                        )
-                        ON CONFLICT (job_id) DO NOTHING
-                    """, {
-                        'job_id': job_data['job_id'],
-                        'job_type': job_data['job_type'],
-                        'config': json.dumps(job_data['config'])
-                    })
-
-                    # Commit transaction
-                    await conn.commit()
-
-                    # Acknowledge message
-                    message.ack()
-
-                    # Log success
-                    await log_to_cloudwatch(env, {
-                        'level': 'INFO',
-                        'message': 'Job created in queue',
-                        'job_id': job_data['job_id'],
-                        'job_type': job_data['job_type']
-                    })
-
-                except Exception as e:
-                    # Log error
-                    await log_to_cloudwatch(env, {
-                        'level': 'ERROR',
-                        'message': f'Failed to process queue message: {str(e)}',
-                        'job_id': job_data.get('job_id', 'unknown'),
-                        'error': str(e)
-                    })
-
-                    # Retry message (don't ack)
-                    message.retry()
+            await cur.execute(f"""
+                UPDATE workers
+                SET last_heartbeat = v.ts, status = 'active', updated_at = NOW()
+                FROM (VALUES {values_sql}) AS v(worker_id, ts)
+                WHERE workers.worker_id = v.worker_id
+            """, params)
+
+        await conn.commit()
+
+    except Exception as e:
+        await conn.rollback()
+
+        await log_to_cloudwatch(env, {
+            'level': 'ERROR',
+            'message': f'Failed to process heartbeat batch: {str(e)}',
+            'worker_ids': list(latest),
+            'error': str(e)
+        })
+
+        for message in messages:
+            message.retry()
+        return
+
+    for message in messages:
+        message.ack()
 
 
 async def get_aurora_credentials(env):
@@ -0,0 +1,12 @@
+-- =============================================
+-- V28: Allow Coordinator to Claim Jobs via Hyperdrive
+-- =============================================
+-- The coordinator now claims jobs with a single
+-- UPDATE ... FOR UPDATE SKIP LOCKED statement instead of
+-- returning claim SQL for the worker to run against Aurora.
+-- Grant hyperdrive_reader only the columns that statement touches.
+-- =============================================
+
+GRANT UPDATE (status, worker_id, claimed_at, updated_at) ON job_queue TO hyperdrive_reader;
+
+COMMENT ON TABLE job_queue IS 'Distributed job queue for loader orchestration (claimed atomically by the coordinator)';
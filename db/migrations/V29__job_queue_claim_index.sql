@@ -0,0 +1,18 @@
+-- =============================================
+-- V29: Partial Index for Job Claiming
+-- =============================================
+-- The coordinator claim query is:
+--   SELECT job_id FROM job_queue
+--   WHERE status = 'pending' AND job_type = ANY($2)
+--   ORDER BY created_at ASC LIMIT 1 FOR UPDATE SKIP LOCKED
+-- A partial index over pending rows only keeps this an index scan
+-- (no sort) as the table grows, and stays small because most rows
+-- are not pending. It also keeps SKIP LOCKED cheap under contention.
+--
+-- CONCURRENTLY cannot run inside a transaction block; run this file
+-- with plain psql -f (no --single-transaction).
+-- =============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_queue_pending_claim
+ON job_queue (status, job_type, created_at)
+WHERE status = 'pending';
@@ -0,0 +1,57 @@
+-- =============================================
+-- V30: Server-side Lookup Functions for the Propose API Client
+-- =============================================
+-- get_entity_provenance() and get_relationship_conflicts() replace the
+-- multi-join SQL the Python client used to send on every call. The client
+-- now issues a one-argument function call; the plans are cached per session.
+-- =============================================
+
+-- Provenance rows with their source type description
+CREATE OR REPLACE VIEW provenance_with_source AS
+SELECT p.*, st.description AS source_description
+FROM provenance p
+LEFT JOIN source_types st ON p.source_type = st.source_type;
+
+-- All node provenance for an entity, newest first
+CREATE OR REPLACE FUNCTION get_entity_provenance(
+    p_entity_id VARCHAR(26)
+) RETURNS SETOF provenance_with_source AS $$
+    SELECT *
+    FROM provenance_with_source
+    WHERE asset_id = p_entity_id AND asset_type = 'node'
+    ORDER BY created_at DESC
+$$ LANGUAGE sql STABLE;
+
+-- Active Legal_Counsel / Opposing_Counsel pairs between two entities
+CREATE OR REPLACE FUNCTION get_relationship_conflicts(
+    p_entity1_id VARCHAR(26),
+    p_entity2_id VARCHAR(26)
+) RETURNS TABLE (
+    rel1_type VARCHAR(50),
+    rel2_type VARCHAR(50),
+    rel1_strength DECIMAL(3,2),
+    rel2_strength DECIMAL(3,2),
+    rel1_created TIMESTAMP,
+    rel2_created TIMESTAMP
+) AS $$
+    SELECT r1.relationship_type, r2.relationship_type,
+           r1.strength, r2.strength,
+           r1.created_at, r2.created_at
+    FROM relationships r1
+    JOIN relationships r2 ON (
+        (r1.source_node_id = r2.source_node_id AND r1.target_node_id = r2.target_node_id) OR
+        (r1.source_node_id = r2.target_node_id AND r1.target_node_id = r2.source_node_id)
+    )
+    WHERE r1.relationship_id != r2.relationship_id
+      AND ((r1.source_node_id = p_entity1_id AND r1.target_node_id = p_entity2_id) OR
+           (r1.source_node_id = p_entity2_id AND r1.target_node_id = p_entity1_id))
+      AND r1.status = 'active' AND r2.status = 'active'
+      AND (
+          (r1.relationship_type = 'Legal_Counsel' AND r2.relationship_type = 'Opposing_Counsel') OR
+          (r1.relationship_type = 'Opposing_Counsel' AND r2.relationship_type = 'Legal_Counsel')
+      )
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON VIEW provenance_with_source IS 'Provenance records joined to their source type description';
+COMMENT ON FUNCTION get_entity_provenance IS 'Node provenance for an entity, newest first (used by the Propose API client)';
+COMMENT ON FUNCTION get_relationship_conflicts IS 'Legal/opposing counsel conflicts between two entities (used by the Propose API client)';
@@ -0,0 +1,71 @@
+-- =============================================
+-- V31: COPY Staging for Bulk Fact Ingestion
+-- =============================================
+-- Large ingest jobs COPY raw facts into staging_facts and then call
+-- propose_fact_from_staging() once per batch, instead of sending one
+-- propose_fact() call per fact from the client. Rows are keyed by a
+-- client-generated batch_id plus the fact's position in the input.
+-- The table is UNLOGGED: staged rows are transient and are deleted
+-- once processed.
+-- =============================================
+
+CREATE UNLOGGED TABLE IF NOT EXISTS staging_facts (
+    batch_id UUID NOT NULL,
+    seq INTEGER NOT NULL,
+    source_node_type VARCHAR(50) NOT NULL,
+    source_node_name VARCHAR(255) NOT NULL,
+    target_node_type VARCHAR(50) NOT NULL,
+    target_node_name VARCHAR(255) NOT NULL,
+    relationship_type VARCHAR(50) NOT NULL,
+    source_name VARCHAR(255) NOT NULL,
+    source_type VARCHAR(50) NOT NULL,
+    source_attributes JSONB,
+    target_attributes JSONB,
+    relationship_strength DECIMAL(3,2),
+    relationship_valid_from DATE,
+    relationship_valid_to DATE,
+    relationship_metadata JSONB,
+    provenance_confidence DECIMAL(3,2),
+    provenance_metadata JSONB,
+    staged_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (batch_id, seq)
+);
+
+-- Run propose_fact() over every staged row of a batch (in seq order), then
+-- clear the batch
+CREATE OR REPLACE FUNCTION propose_fact_from_staging(
+    p_batch_id UUID
+) RETURNS TABLE (
+    seq INTEGER,
+    status VARCHAR(20),
+    overall_confidence DECIMAL(3,2),
+    actions JSONB,
+    conflicts JSONB,
+    provenance_ids JSONB
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT s.seq, r.status, r.overall_confidence, r.actions, r.conflicts, r.provenance_ids
+    FROM staging_facts s
+    CROSS JOIN LATERAL propose_fact(
+        s.source_node_type, s.source_node_name,
+        s.target_node_type, s.target_node_name,
+        s.relationship_type,
+        s.source_name, s.source_type,
+        COALESCE(s.source_attributes, '[]'::JSONB),
+        COALESCE(s.target_attributes, '[]'::JSONB),
+        COALESCE(s.relationship_strength, 1.0),
+        s.relationship_valid_from, s.relationship_valid_to,
+        s.relationship_metadata,
+        COALESCE(s.provenance_confidence, 0.9),
+        s.provenance_metadata
+    ) AS r
+    WHERE s.batch_id = p_batch_id
+    ORDER BY s.seq;
+
+    DELETE FROM staging_facts WHERE batch_id = p_batch_id;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON TABLE staging_facts IS 'Transient COPY target for bulk fact ingestion (see propose_fact_from_staging)';
+COMMENT ON FUNCTION propose_fact_from_staging IS 'Process and clear one batch of staged facts through propose_fact()';
@@ -0,0 +1,39 @@
+-- =============================================
+-- V32: Single-call Bulk Propose
+-- =============================================
+-- propose_facts_bulk() takes a whole batch as one JSONB array and runs
+-- propose_fact() over it server-side, so a batch costs one round trip.
+-- Each element is a 15-item array in propose_fact() parameter order, with
+-- every value as text (or null); JSONB parameters are JSON-encoded text.
+-- seq is the element's 0-based position in the input array.
+-- =============================================
+
+CREATE OR REPLACE FUNCTION propose_facts_bulk(
+    p_facts JSONB
+) RETURNS TABLE (
+    seq INTEGER,
+    status VARCHAR(20),
+    overall_confidence DECIMAL(3,2),
+    actions JSONB,
+    conflicts JSONB,
+    provenance_ids JSONB
+) AS $$
+    SELECT (f.n - 1)::INTEGER, r.status, r.overall_confidence, r.actions, r.conflicts, r.provenance_ids
+    FROM jsonb_array_elements(p_facts) WITH ORDINALITY AS f(fact, n)
+    CROSS JOIN LATERAL propose_fact(
+        f.fact->>0, f.fact->>1,
+        f.fact->>2, f.fact->>3,
+        f.fact->>4,
+        f.fact->>5, f.fact->>6,
+        COALESCE((f.fact->>7)::JSONB, '[]'::JSONB),
+        COALESCE((f.fact->>8)::JSONB, '[]'::JSONB),
+        COALESCE((f.fact->>9)::DECIMAL, 1.0),
+        (f.fact->>10)::DATE, (f.fact->>11)::DATE,
+        (f.fact->>12)::JSONB,
+        COALESCE((f.fact->>13)::DECIMAL, 0.9),
+        (f.fact->>14)::JSONB
+    ) AS r
+    ORDER BY f.n
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION propose_facts_bulk IS 'Run propose_fact() over a JSONB array of facts in one call (used by the Propose API client)';
@@ -1,13 +1,36 @@
 #!/usr/bin/env python3
 import csv
+import io
+import mmap
 
-# Check what the home office city/state values are for the first few records
-with open('examples/data/Active_Iowa_Business_Entities_20251001.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    for i, row in enumerate(reader):
-        if i >= 10:
-            break
-        print(f"Row {i+1}: {row.get('Legal Name', '')}")
-        print(f"  HO City: '{row.get('HO City', '')}' (empty: {not row.get('HO City', '').strip()})")
-        print(f"  HO State: '{row.get('HO State', '')}' (empty: {not row.get('HO State', '').strip()})")
-        print(f"  HO Location: '{row.get('HO Location', '')}'\n")
\ No newline at end of file
+ROWS = 10
+
+# Check what the home office city/state values are for the first few records.
+# Only the header plus the first ROWS lines are decoded; the rest of the file is never read.
+with open('examples/data/Active_Iowa_Business_Entities_20251001.csv', 'rb') as f:
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = 0
+        for _ in range(ROWS + 1):
+            nl = mm.find(b'\n', end)
+            if nl < 0:
+                end = len(mm)
+                break
+            end = nl + 1
+        chunk = mm[:end].decode('utf-8')
+
+reader = csv.reader(io.StringIO(chunk, newline=''))
+header = next(reader)
+name_idx = header.index('Legal Name')
+city_idx = header.index('HO City')
+state_idx = header.index('HO State')
+location_idx = header.index('HO Location')
+
+for i, row in enumerate(reader):
+    if i >= ROWS:
+        break
+    city = row[city_idx]
+    state = row[state_idx]
+    print(f"Row {i+1}: {row[name_idx]}")
+    print(f"  HO City: '{city}' (empty: {not city.strip()})")
+    print(f"  HO State: '{state}' (empty: {not state.strip()})")
+    print(f"  HO Location: '{row[location_idx]}'\n")
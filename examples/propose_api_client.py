@@ -20,23 +20,155 @@ Usage:
         print(f"Error: {result.error_message}")
 """
 
+import functools
+import io
 import json
 import logging
 import sys
 import os
+import uuid
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Union, Any
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any, cast
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
 from psycopg2.extras import RealDictCursor
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
 # Add the src directory to the path for type imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-from graph_types import NodeType, RelationshipType, EntityClass, RelationshipRegistry
+from graph_types import NodeType, RelationshipType, EntityClass
+
+# Enum value sets built once at import; validation is a set lookup per fact
+_VALID_NODE_TYPES = frozenset(nt.value for nt in NodeType)
+_VALID_REL_TYPES = frozenset(rt.value for rt in RelationshipType)
+_NODE_TYPES_LIST = [nt.value for nt in NodeType]
+_REL_TYPES_LIST = [rt.value for rt in RelationshipType]
+
+
+# propose_fact() result columns; JSONB comes back as text and is decoded once
+# in Python (faster than psycopg2's default json.loads typecaster)
+_RESPONSE_COLUMNS = (
+    "status, overall_confidence, "
+    "actions::TEXT AS actions, conflicts::TEXT AS conflicts, "
+    "provenance_ids::TEXT AS provenance_ids"
+)
+
+
+def _loads(text: Optional[str]) -> Any:
+    """Decode a JSONB column returned as text (NULL -> empty list)"""
+    if text is None:
+        return []
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(value: Any) -> str:
+    """Encode a value as a JSON string for a JSONB parameter"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+# Batch dispatch: each page of facts becomes one VALUES list joined laterally
+# to propose_fact(), ordered by its position in the page
+BATCH_PAGE_SIZE = 500
+
+# Rows fetched per round trip by the server-side lookup cursors
+LOOKUP_ITERSIZE = 1000
+
+BATCH_PROPOSE_SQL = f"""
+SELECT {_RESPONSE_COLUMNS}
+FROM (VALUES %s) AS v(
+    n, source_type, source_name, target_type, target_name, relationship_type,
+    source_name_info, source_type_info, source_attributes, target_attributes,
+    strength, valid_from, valid_to, relationship_metadata,
+    provenance_confidence, provenance_metadata
+)
+CROSS JOIN LATERAL propose_fact(
+    v.source_type, v.source_name,
+    v.target_type, v.target_name,
+    v.relationship_type,
+    v.source_name_info, v.source_type_info,
+    v.source_attributes, v.target_attributes,
+    v.strength,
+    v.valid_from, v.valid_to,
+    v.relationship_metadata,
+    v.provenance_confidence,
+    v.provenance_metadata
+) AS r
+ORDER BY v.n
+"""
+
+# Explicit casts so every VALUES column is typed even when a page is all NULLs
+BATCH_PROPOSE_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, %s::JSONB, %s::JSONB, "
+    "%s::DECIMAL, %s::DATE, %s::DATE, %s::JSONB, %s::DECIMAL, %s::JSONB)"
+)
 
+# Single-fact path: propose_fact() is PREPAREd once per pooled connection and
+# EXECUTEd with the parameter tuple from _normalize_fact() (parameter types are
+# fixed by the PREPARE, so no ::JSONB casts)
+PREPARE_PROPOSE_SQL = f"""
+PREPARE propose_fact_stmt (
+    VARCHAR, VARCHAR,  -- source entity
+    VARCHAR, VARCHAR,  -- target entity
+    VARCHAR,           -- relationship
+    VARCHAR, VARCHAR,  -- source info
+    JSONB, JSONB,      -- attributes
+    DECIMAL,           -- relationship strength
+    DATE, DATE,        -- relationship validity
+    JSONB,             -- relationship metadata
+    DECIMAL,           -- provenance confidence
+    JSONB              -- provenance metadata
+) AS
+SELECT {_RESPONSE_COLUMNS} FROM propose_fact($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15)
+"""
+
+EXECUTE_PROPOSE_SQL = (
+    "EXECUTE propose_fact_stmt (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+)
+
+
+# Single-call path: the whole batch is sent as one JSONB array of parameter
+# lists and expanded server-side by propose_facts_bulk()
+BULK_PROPOSE_SQL = f"SELECT seq, {_RESPONSE_COLUMNS} FROM propose_facts_bulk(%s::JSONB)"
+
+# Bulk staging: facts are COPYed (text format) into staging_facts and then
+# processed server-side by propose_fact_from_staging() in one call
+STAGING_COLUMNS = (
+    "batch_id", "seq",
+    "source_node_type", "source_node_name", "target_node_type", "target_node_name",
+    "relationship_type", "source_name", "source_type",
+    "source_attributes", "target_attributes",
+    "relationship_strength", "relationship_valid_from", "relationship_valid_to",
+    "relationship_metadata", "provenance_confidence", "provenance_metadata"
+)
+
+STAGE_FACTS_COPY_SQL = f"COPY staging_facts ({', '.join(STAGING_COLUMNS)}) FROM STDIN"
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
 
-@dataclass
+
+def _copy_field(value: Any) -> str:
+    """Render one value as a COPY text-format field"""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+@dataclass(slots=True)
 class ProposeResponse:
     """Response from the Propose API"""
     success: bool
@@ -46,13 +178,164 @@ class ProposeResponse:
     conflicts: List[Dict[str, Any]] = field(default_factory=list)
     provenance_ids: List[str] = field(default_factory=list)
     error_message: Optional[str] = None
-    raw_response: Optional[Dict] = None
+    raw_response: Optional[Dict[str, Any]] = None
+
+
+# =============================================
+# Fact normalization (hot path for batch_propose_facts)
+# =============================================
+# Kept as plain module functions over builtin types, with no client state,
+# so the per-fact loop runs without method dispatch.
+
+@functools.lru_cache(maxsize=4096)
+def _validate_triple(source_type: str, target_type: str, relationship_str: str) -> Optional[str]:
+    """
+    Validate a (source type, target type, relationship) triple
+    
+    Returns:
+        None if valid, otherwise the error message. Batches repeat a handful
+        of triples, so results are cached.
+    """
+    if relationship_str not in _VALID_REL_TYPES:
+        return f"Invalid relationship type: '{relationship_str}'. Valid types: {_REL_TYPES_LIST}"
+    
+    if source_type not in _VALID_NODE_TYPES:
+        return f"Invalid source node type: '{source_type}'. Valid types: {_NODE_TYPES_LIST}"
+    
+    if target_type not in _VALID_NODE_TYPES:
+        return f"Invalid target node type: '{target_type}'. Valid types: {_NODE_TYPES_LIST}"
+    
+    return None
+
+
+# Shared JSONB literal for facts without attributes
+_EMPTY_JSONB = '[]'
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_attribute_items(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """Encode attribute (type, value) pairs in propose API format"""
+    return _dumps([
+        {"type": attr_type, "value": value}
+        for attr_type, value in items
+    ])
+
+
+def _format_attributes(attributes: Optional[Dict[str, str]]) -> str:
+    """
+    Format attributes dictionary to JSONB string
+    
+    Imports repeat the same small attribute dicts (e.g. {'title': 'Developer'})
+    many times, so encodings are cached by their items in insertion order.
+    Only all-string attributes are cached: cache keys compare True == 1 == 1.0,
+    so other values would be served another type's encoding.
+    """
+    if not attributes:
+        return _EMPTY_JSONB
+    
+    items = tuple(attributes.items())
+    if all(type(value) is str for _, value in items):
+        return _format_attribute_items(items)
+    return _format_attribute_items.__wrapped__(items)
+
+
+def _normalize_fact(
+    source_entity: Tuple[Union[str, NodeType], str],
+    target_entity: Tuple[Union[str, NodeType], str],
+    relationship: Union[str, RelationshipType],
+    source_info: Tuple[str, str],
+    source_attributes: Optional[Dict[str, str]] = None,
+    target_attributes: Optional[Dict[str, str]] = None,
+    relationship_strength: float = 1.0,
+    relationship_valid_from: Optional[date] = None,
+    relationship_valid_to: Optional[date] = None,
+    relationship_metadata: Optional[Dict[str, Any]] = None,
+    provenance_confidence: float = 0.9,
+    provenance_metadata: Optional[Dict[str, Any]] = None
+) -> Union[Tuple[Any, ...], ProposeResponse]:
+    """
+    Validate a fact and build the propose_fact() parameter tuple
+
+    Returns:
+        Tuple of the 15 propose_fact() parameters, or an error
+        ProposeResponse if the fact is invalid. Malformed arguments (e.g. a
+        non-tuple entity) raise; callers turn that into an error response.
+    """
+    # Convert enums to string values if needed (exact type checks; the
+    # enums aren't subclassed)
+    source_type = source_entity[0].value if type(source_entity[0]) is NodeType else source_entity[0]
+    target_type = target_entity[0].value if type(target_entity[0]) is NodeType else target_entity[0]
+    relationship_str = relationship.value if type(relationship) is RelationshipType else relationship
+
+    # Validate relationship and node types
+    validation_error = _validate_triple(source_type, target_type, relationship_str)
+    if validation_error is not None:
+        return ProposeResponse(
+            success=False,
+            status='error',
+            overall_confidence=0.0,
+            error_message=validation_error
+        )
+
+    return (
+        source_type, source_entity[1],       # source (normalized)
+        target_type, target_entity[1],       # target (normalized)
+        relationship_str,                     # relationship (normalized)
+        source_info[0], source_info[1],      # source info
+        _format_attributes(source_attributes),  # source attrs
+        _format_attributes(target_attributes),  # target attrs
+        relationship_strength,                # strength
+        relationship_valid_from,              # valid from
+        relationship_valid_to,                # valid to
+        _dumps(relationship_metadata) if relationship_metadata else None,
+        provenance_confidence,                # prov confidence
+        _dumps(provenance_metadata) if provenance_metadata else None
+    )
+
+
+def _normalize_batch(
+    facts: List[Dict[str, Any]]
+) -> Tuple[List[Tuple[int, Tuple[Any, ...]]], Dict[int, ProposeResponse]]:
+    """
+    Normalize a list of fact dicts
+    
+    Returns:
+        (pending, errors): pending is a list of (index, params) for valid facts;
+        errors maps the index of each invalid fact to its error response
+    """
+    normalize = _normalize_fact
+    pending: List[Tuple[int, Tuple[Any, ...]]] = []
+    errors: Dict[int, ProposeResponse] = {}
+    
+    for i, fact in enumerate(facts):
+        try:
+            params = normalize(**fact)
+        except Exception as e:
+            errors[i] = ProposeResponse(
+                success=False,
+                status='error',
+                overall_confidence=0.0,
+                error_message=f"Processing error: {str(e)}"
+            )
+            continue
+        
+        if isinstance(params, tuple):
+            pending.append((i, params))
+        else:
+            errors[i] = params
+    
+    return pending, errors
 
 
 class ProposeAPIClient:
     """Client for interacting with the Propose API intelligent fact ingestion system"""
     
-    def __init__(self, connection_params: Dict[str, str]):
+    def __init__(
+        self,
+        connection_params: Dict[str, Any],
+        min_connections: int = 1,
+        max_connections: int = 8
+    ) -> None:
         """
         Initialize the Propose API client
         
@@ -65,54 +348,80 @@ class ProposeAPIClient:
                     'password': 'your_password',
                     'port': 5432
                 }
+            min_connections: Connections the pool keeps open
+            max_connections: Upper bound on pooled connections
         """
         self.connection_params = connection_params
         self.logger = logging.getLogger(__name__)
         
-    def _get_connection(self):
-        """Get database connection"""
+        # Pooled connections that already have the fast JSONB typecaster
+        # registered / propose_fact_stmt prepared
+        self._initialized: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+        self._prepared: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+        
+        # Connections are opened once and reused across calls instead of
+        # paying a TCP + TLS + auth handshake per call
         try:
-            return psycopg2.connect(
+            self._pool = psycopg2.pool.ThreadedConnectionPool(
+                min_connections,
+                max_connections,
                 cursor_factory=RealDictCursor,
-                **self.connection_params
+                **connection_params
             )
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
+        
+    @contextmanager
+    def _get_connection(self) -> Iterator[Any]:
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        conn = self._pool.getconn()
+        if conn not in self._initialized:
+            # Remaining JSONB result columns (e.g. provenance metadata) decode
+            # with orjson instead of the stdlib json typecaster
+            if orjson is not None:
+                psycopg2.extras.register_default_jsonb(conn, loads=orjson.loads)
+            self._initialized.add(conn)
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            # Includes GeneratorExit when a streaming lookup is closed early
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn)
+    
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self._pool.closeall()
+    
+    def _ensure_prepared(self, conn: Any) -> None:
+        """PREPARE the propose_fact() call once per pooled connection"""
+        if conn in self._prepared:
+            return
+        
+        with conn.cursor() as cursor:
+            cursor.execute(PREPARE_PROPOSE_SQL)
+        # Prepared statements live for the session; commit so the PREPARE
+        # isn't tied to the outcome of the first proposal's transaction
+        conn.commit()
+        self._prepared.add(conn)
     
     def _format_attributes(self, attributes: Optional[Dict[str, str]]) -> str:
         """Format attributes dictionary to JSONB string"""
-        if not attributes:
-            return '[]'
-        
-        # Convert to propose API format
-        formatted = []
-        for attr_type, value in attributes.items():
-            formatted.append({
-                "type": attr_type,
-                "value": value
-            })
-        
-        return json.dumps(formatted)
+        return _format_attributes(attributes)
     
-    def _parse_response(self, raw_result: Dict) -> ProposeResponse:
+    def _parse_response(self, raw_result: Dict[str, Any]) -> ProposeResponse:
         """Parse database response into ProposeResponse object"""
         try:
             status = raw_result.get('status', 'error')
             success = status in ['success', 'conflicts']
 
-            # Parse JSONB fields
-            actions = raw_result.get('actions', [])
-            if isinstance(actions, str):
-                actions = json.loads(actions)
-
-            conflicts = raw_result.get('conflicts', [])
-            if isinstance(conflicts, str):
-                conflicts = json.loads(conflicts)
-
-            provenance_ids = raw_result.get('provenance_ids', [])
-            if isinstance(provenance_ids, str):
-                provenance_ids = json.loads(provenance_ids)
+            # Parse JSONB fields (selected as text, see _RESPONSE_COLUMNS)
+            actions = _loads(raw_result.get('actions'))
+            conflicts = _loads(raw_result.get('conflicts'))
+            provenance_ids = _loads(raw_result.get('provenance_ids'))
 
             # Extract error message from actions if status is error
             error_message = None
@@ -154,9 +463,9 @@ class ProposeAPIClient:
         relationship_strength: float = 1.0,
         relationship_valid_from: Optional[date] = None,
         relationship_valid_to: Optional[date] = None,
-        relationship_metadata: Optional[Dict] = None,
+        relationship_metadata: Optional[Dict[str, Any]] = None,
         provenance_confidence: float = 0.9,
-        provenance_metadata: Optional[Dict] = None
+        provenance_metadata: Optional[Dict[str, Any]] = None
     ) -> ProposeResponse:
         """
         Propose a fact to the intelligent ingestion system
@@ -189,40 +498,13 @@ class ProposeAPIClient:
             )
         """
         
-        # Validate and normalize input parameters
         try:
-            # Convert enums to string values if needed
-            source_type = source_entity[0].value if isinstance(source_entity[0], NodeType) else source_entity[0]
-            target_type = target_entity[0].value if isinstance(target_entity[0], NodeType) else target_entity[0]
-            relationship_str = relationship.value if isinstance(relationship, RelationshipType) else relationship
-            
-            # Validate node types
-            if not RelationshipRegistry.validate_relationship_type(relationship_str):
-                return ProposeResponse(
-                    success=False,
-                    status='error',
-                    overall_confidence=0.0,
-                    error_message=f"Invalid relationship type: '{relationship_str}'. Valid types: {[rt.value for rt in RelationshipType]}"
-                )
-            
-            # Validate node types
-            from graph_types import validate_node_type
-            if not validate_node_type(source_type):
-                return ProposeResponse(
-                    success=False,
-                    status='error', 
-                    overall_confidence=0.0,
-                    error_message=f"Invalid source node type: '{source_type}'. Valid types: {[nt.value for nt in NodeType]}"
-                )
-                
-            if not validate_node_type(target_type):
-                return ProposeResponse(
-                    success=False,
-                    status='error',
-                    overall_confidence=0.0,
-                    error_message=f"Invalid target node type: '{target_type}'. Valid types: {[nt.value for nt in NodeType]}"
-                )
-            
+            params = _normalize_fact(
+                source_entity, target_entity, relationship, source_info,
+                source_attributes, target_attributes, relationship_strength,
+                relationship_valid_from, relationship_valid_to, relationship_metadata,
+                provenance_confidence, provenance_metadata
+            )
         except Exception as e:
             return ProposeResponse(
                 success=False,
@@ -230,44 +512,15 @@ class ProposeAPIClient:
                 overall_confidence=0.0,
                 error_message=f"Validation error: {str(e)}"
             )
+        if isinstance(params, ProposeResponse):
+            return params
         
         try:
             with self._get_connection() as conn:
+                self._ensure_prepared(conn)
                 with conn.cursor() as cursor:
-                    # Prepare SQL call
-                    sql = """
-                    SELECT * FROM propose_fact(
-                        %s, %s,  -- source entity
-                        %s, %s,  -- target entity  
-                        %s,      -- relationship
-                        %s, %s,  -- source info
-                        %s::JSONB, %s::JSONB,  -- attributes
-                        %s,      -- relationship strength
-                        %s, %s,  -- relationship validity
-                        %s::JSONB,  -- relationship metadata
-                        %s,      -- provenance confidence
-                        %s::JSONB   -- provenance metadata
-                    )
-                    """
-                    
-                    # Prepare parameters
-                    params = [
-                        source_type, source_entity[1],       # source (normalized)
-                        target_type, target_entity[1],       # target (normalized)
-                        relationship_str,                     # relationship (normalized)
-                        source_info[0], source_info[1],      # source info
-                        self._format_attributes(source_attributes),  # source attrs
-                        self._format_attributes(target_attributes),  # target attrs
-                        relationship_strength,                # strength
-                        relationship_valid_from,              # valid from
-                        relationship_valid_to,                # valid to
-                        json.dumps(relationship_metadata) if relationship_metadata else None,
-                        provenance_confidence,                # prov confidence
-                        json.dumps(provenance_metadata) if provenance_metadata else None
-                    ]
-                    
-                    # Execute query
-                    cursor.execute(sql, params)
+                    # Execute the statement prepared on this connection
+                    cursor.execute(EXECUTE_PROPOSE_SQL, params)
                     result = cursor.fetchone()
                     
                     if not result:
@@ -278,7 +531,7 @@ class ProposeAPIClient:
                             error_message="No response from database"
                         )
                     
-                    return self._parse_response(dict(result))
+                    return self._parse_response(result)
                     
         except psycopg2.Error as e:
             self.logger.error(f"Database error in propose_fact: {e}")
@@ -297,12 +550,86 @@ class ProposeAPIClient:
                 error_message=f"Unexpected error: {str(e)}"
             )
     
+    def _propose_page(
+        self,
+        conn: Any,
+        page: List[Tuple[int, Tuple[Any, ...]]],
+        results: List[Optional[ProposeResponse]]
+    ) -> None:
+        """
+        Send one page of normalized facts as a single statement and commit it,
+        filling results in place
+        
+        If the page statement fails, its facts are retried one at a time so a
+        single bad fact fails alone rather than taking the page with it.
+        """
+        try:
+            with conn.cursor() as cursor:
+                rows = psycopg2.extras.execute_values(
+                    cursor,
+                    BATCH_PROPOSE_SQL,
+                    [(n,) + params for n, (_, params) in enumerate(page)],
+                    template=BATCH_PROPOSE_TEMPLATE,
+                    page_size=BATCH_PAGE_SIZE,
+                    fetch=True
+                )
+            conn.commit()
+            
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Error processing batch page, retrying its facts individually: {e}")
+            self._propose_each(conn, page, results)
+            return
+        
+        for (i, _), row in zip(page, rows):
+            results[i] = self._parse_response(row)
+    
+    def _propose_each(
+        self,
+        conn: Any,
+        page: List[Tuple[int, Tuple[Any, ...]]],
+        results: List[Optional[ProposeResponse]]
+    ) -> None:
+        """Propose normalized facts one per transaction, filling results in place"""
+        self._ensure_prepared(conn)
+        for i, params in page:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(EXECUTE_PROPOSE_SQL, params)
+                    row = cursor.fetchone()
+                conn.commit()
+                
+            except Exception as e:
+                conn.rollback()
+                self.logger.error(f"Error processing fact {i}: {e}")
+                results[i] = ProposeResponse(
+                    success=False,
+                    status='error',
+                    overall_confidence=0.0,
+                    error_message=f"Processing error: {str(e)}"
+                )
+                continue
+            
+            results[i] = self._parse_response(row) if row else ProposeResponse(
+                success=False,
+                status='error',
+                overall_confidence=0.0,
+                error_message="No response from database"
+            )
+    
     def batch_propose_facts(
         self, 
         facts: List[Dict[str, Any]]
     ) -> List[ProposeResponse]:
         """
-        Process multiple facts in sequence
+        Process multiple facts in batched round-trips
+        
+        All facts are validated first; valid facts are then sent to
+        propose_fact() in pages of BATCH_PAGE_SIZE, each page as one multi-row
+        statement in its own transaction. Pages run one after another on a
+        single connection: propose_fact() looks entities up before inserting
+        them without any lock, so concurrent pages naming the same entity
+        would each create it. Results keep input order.
         
         Args:
             facts: List of fact dictionaries with same parameters as propose_fact
@@ -328,93 +655,266 @@ class ProposeAPIClient:
             
             results = client.batch_propose_facts(facts)
         """
-        results = []
+        results: List[Optional[ProposeResponse]] = [None] * len(facts)
+        
+        # Validate everything up front; invalid facts get their error response
+        # and never reach the database
+        pending, errors = _normalize_batch(facts)
+        for i, error in errors.items():
+            results[i] = error
         
-        for i, fact in enumerate(facts):
+        if pending:
+            pages = [
+                pending[start:start + BATCH_PAGE_SIZE]
+                for start in range(0, len(pending), BATCH_PAGE_SIZE)
+            ]
+            
             try:
-                result = self.propose_fact(**fact)
-                results.append(result)
+                with self._get_connection() as conn:
+                    for page in pages:
+                        self._propose_page(conn, page, results)
+            except Exception as e:
+                # Could not borrow a connection; every fact not yet answered fails
+                self.logger.error(f"Error processing batch: {e}")
+                for i, _ in pending:
+                    if results[i] is None:
+                        results[i] = ProposeResponse(
+                            success=False,
+                            status='error',
+                            overall_confidence=0.0,
+                            error_message=f"Processing error: {str(e)}"
+                        )
+            
+            self.logger.info(f"Processed {len(facts)} facts ({len(pending)} sent to database)")
+        
+        # Every slot has been filled above
+        return cast(List[ProposeResponse], results)
+    
+    def bulk_propose_facts(
+        self,
+        facts: List[Dict[str, Any]]
+    ) -> List[ProposeResponse]:
+        """
+        Process multiple facts with a single database call
+        
+        Valid facts are encoded as one JSONB array and proposed by
+        propose_facts_bulk() in one round trip and one transaction. Prefer
+        batch_propose_facts() when a batch is too large for one statement.
+        
+        Args:
+            facts: List of fact dictionaries with same parameters as propose_fact
+            
+        Returns:
+            List of ProposeResponse objects in input order
+        """
+        results: List[Optional[ProposeResponse]] = [None] * len(facts)
+        
+        pending, errors = _normalize_batch(facts)
+        for i, error in errors.items():
+            results[i] = error
+        
+        if pending:
+            # Every value goes over as text and is cast back server-side
+            payload = _dumps([
+                [None if value is None else str(value) for value in params]
+                for _, params in pending
+            ])
+            try:
+                with self._get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute(BULK_PROPOSE_SQL, (payload,))
+                        rows = cursor.fetchall()
+                
+                for row in rows:
+                    results[pending[row['seq']][0]] = self._parse_response(row)
                 
-                # Log progress for large batches
-                if (i + 1) % 100 == 0:
-                    self.logger.info(f"Processed {i + 1}/{len(facts)} facts")
-                    
             except Exception as e:
-                self.logger.error(f"Error processing fact {i}: {e}")
-                results.append(ProposeResponse(
+                self.logger.error(f"Error processing bulk batch: {e}")
+                for i, _ in pending:
+                    results[i] = ProposeResponse(
+                        success=False,
+                        status='error',
+                        overall_confidence=0.0,
+                        error_message=f"Processing error: {str(e)}"
+                    )
+        
+        return cast(List[ProposeResponse], results)
+    
+    def stage_facts_copy(
+        self,
+        facts: List[Dict[str, Any]]
+    ) -> Tuple[str, Dict[int, ProposeResponse]]:
+        """
+        Validate facts and COPY the valid ones into staging_facts
+        
+        Staged rows are committed and are not proposed until
+        propose_staged_facts() is called with the returned batch ID; callers
+        doing both in one go should use copy_propose_facts(), which keeps
+        them in one transaction.
+        
+        Args:
+            facts: List of fact dictionaries with same parameters as propose_fact
+            
+        Returns:
+            (batch_id, errors): errors maps the index of each invalid fact
+            to its error response
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                return self._stage_facts(cursor, facts)
+    
+    def _stage_facts(self, cursor: Any, facts: List[Dict[str, Any]]) -> Tuple[str, Dict[int, ProposeResponse]]:
+        """COPY the valid facts into staging_facts on cursor's transaction (no commit)"""
+        batch_id = str(uuid.uuid4())
+        pending, errors = _normalize_batch(facts)
+        
+        buf = io.StringIO()
+        for i, params in pending:
+            buf.write(batch_id)
+            buf.write('\t')
+            buf.write(str(i))
+            for value in params:
+                buf.write('\t')
+                buf.write(_copy_field(value))
+            buf.write('\n')
+        buf.seek(0)
+        
+        cursor.copy_expert(STAGE_FACTS_COPY_SQL, buf)
+        
+        self.logger.info(f"Staged {len(pending)} of {len(facts)} facts as batch {batch_id}")
+        return batch_id, errors
+    
+    def propose_staged_facts(self, batch_id: str) -> Dict[int, ProposeResponse]:
+        """
+        Process a staged batch through propose_fact() server-side
+        
+        Args:
+            batch_id: Batch ID returned by stage_facts_copy
+            
+        Returns:
+            Responses keyed by each fact's index in the staged input
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                return self._propose_staged(cursor, batch_id)
+    
+    def _propose_staged(self, cursor: Any, batch_id: str) -> Dict[int, ProposeResponse]:
+        """Run propose_fact_from_staging() for a batch on cursor's transaction (no commit)"""
+        cursor.execute(
+            f"SELECT seq, {_RESPONSE_COLUMNS} FROM propose_fact_from_staging(%s)",
+            (batch_id,)
+        )
+        return {row['seq']: self._parse_response(row) for row in cursor.fetchall()}
+    
+    def copy_propose_facts(
+        self,
+        facts: List[Dict[str, Any]]
+    ) -> List[ProposeResponse]:
+        """
+        Process multiple facts through the COPY staging path
+        
+        Stages and proposes the facts in one transaction, returning
+        responses in input order like batch_propose_facts(). If proposing
+        fails, the COPY rolls back with it, so no rows are left behind in
+        staging_facts.
+        
+        Args:
+            facts: List of fact dictionaries with same parameters as propose_fact
+            
+        Returns:
+            List of ProposeResponse objects
+        """
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    batch_id, responses = self._stage_facts(cursor, facts)
+                    responses.update(self._propose_staged(cursor, batch_id))
+        except Exception as e:
+            self.logger.error(f"Error processing staged batch: {e}")
+            return [
+                ProposeResponse(
                     success=False,
                     status='error',
                     overall_confidence=0.0,
                     error_message=f"Processing error: {str(e)}"
-                ))
+                )
+                for _ in facts
+            ]
         
-        return results
+        return [responses[i] for i in range(len(facts))]
     
-    def get_entity_provenance(self, entity_id: str) -> List[Dict]:
+    def iter_entity_provenance(self, entity_id: str) -> Iterator[Dict[str, Any]]:
         """
-        Get provenance records for a specific entity
+        Stream provenance records for a specific entity
+        
+        Rows are read through a server-side cursor LOOKUP_ITERSIZE at a time,
+        so the full result set is never buffered. The pooled connection is
+        held until the generator is exhausted or closed.
         
         Args:
             entity_id: ULID of the entity
             
-        Returns:
-            List of provenance records
+        Yields:
+            Provenance records
         """
         try:
             with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    sql = """
-                    SELECT p.*, st.description as source_description
-                    FROM provenance p
-                    LEFT JOIN source_types st ON p.source_type = st.source_type
-                    WHERE p.asset_id = %s AND p.asset_type = 'node'
-                    ORDER BY p.created_at DESC
-                    """
-                    cursor.execute(sql, (entity_id,))
-                    return [dict(row) for row in cursor.fetchall()]
+                with conn.cursor(name='entity_provenance_cur') as cursor:
+                    cursor.itersize = LOOKUP_ITERSIZE
+                    cursor.execute("SELECT * FROM get_entity_provenance(%s)", (entity_id,))
+                    # RealDictRow is already a dict; rows are yielded as-is
+                    yield from cursor
                     
         except Exception as e:
             self.logger.error(f"Error getting provenance: {e}")
-            return []
     
-    def get_relationship_conflicts(self, entity1_id: str, entity2_id: str) -> List[Dict]:
+    def get_entity_provenance(self, entity_id: str) -> List[Dict[str, Any]]:
         """
-        Check for relationship conflicts between two entities
+        Get provenance records for a specific entity
+        
+        Args:
+            entity_id: ULID of the entity
+            
+        Returns:
+            List of provenance records
+        """
+        return list(self.iter_entity_provenance(entity_id))
+    
+    def iter_relationship_conflicts(self, entity1_id: str, entity2_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream relationship conflicts between two entities
+        
+        Uses a server-side cursor, like iter_entity_provenance.
         
         Args:
             entity1_id: ULID of first entity
             entity2_id: ULID of second entity
             
-        Returns:
-            List of conflicting relationships
+        Yields:
+            Conflicting relationships
         """
         try:
             with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    sql = """
-                    SELECT r1.relationship_type as rel1_type, r2.relationship_type as rel2_type,
-                           r1.strength as rel1_strength, r2.strength as rel2_strength,
-                           r1.created_at as rel1_created, r2.created_at as rel2_created
-                    FROM relationships r1
-                    JOIN relationships r2 ON (
-                        (r1.source_node_id = r2.source_node_id AND r1.target_node_id = r2.target_node_id) OR
-                        (r1.source_node_id = r2.target_node_id AND r1.target_node_id = r2.source_node_id)
-                    )
-                    WHERE r1.relationship_id != r2.relationship_id
-                      AND ((r1.source_node_id = %s AND r1.target_node_id = %s) OR
-                           (r1.source_node_id = %s AND r1.target_node_id = %s))
-                      AND r1.status = 'active' AND r2.status = 'active'
-                      AND (
-                          (r1.relationship_type = 'Legal_Counsel' AND r2.relationship_type = 'Opposing_Counsel') OR
-                          (r1.relationship_type = 'Opposing_Counsel' AND r2.relationship_type = 'Legal_Counsel')
-                      )
-                    """
-                    cursor.execute(sql, (entity1_id, entity2_id, entity2_id, entity1_id))
-                    return [dict(row) for row in cursor.fetchall()]
+                with conn.cursor(name='relationship_conflicts_cur') as cursor:
+                    cursor.itersize = LOOKUP_ITERSIZE
+                    cursor.execute("SELECT * FROM get_relationship_conflicts(%s, %s)", (entity1_id, entity2_id))
+                    yield from cursor
                     
         except Exception as e:
             self.logger.error(f"Error checking conflicts: {e}")
-            return []
+    
+    def get_relationship_conflicts(self, entity1_id: str, entity2_id: str) -> List[Dict[str, Any]]:
+        """
+        Check for relationship conflicts between two entities
+        
+        Args:
+            entity1_id: ULID of first entity
+            entity2_id: ULID of second entity
+            
+        Returns:
+            List of conflicting relationships
+        """
+        return list(self.iter_relationship_conflicts(entity1_id, entity2_id))
 
 
 # Example usage and test cases
@@ -498,4 +998,6 @@ if __name__ == "__main__":
     print(f"   Average confidence: {sum(r.overall_confidence for r in batch_results) / len(batch_results):.2f}")
     print()
     
+    client.close()
+    
     print("=== Demo Complete ===")
\ No newline at end of file
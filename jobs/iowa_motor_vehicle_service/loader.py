@@ -6,15 +6,85 @@ Loads licensed motor vehicle service contract companies from Iowa state data
 import sys
 import os
 import csv
-from typing import Dict, List, Optional
-
-# Add parent directories to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'examples'))
+import functools
+import logging
+import queue
+import unicodedata
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directories to path (once, even if this module is reloaded)
+_ROOT = Path(__file__).resolve().parents[2]
+for _path in (str(_ROOT), str(_ROOT / 'examples')):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 # Import the real ProposeAPIClient
 from propose_api_client import ProposeAPIClient
 
+logger = logging.getLogger(__name__)
+
+# Records are queued and written by a listener thread during a run, so the
+# load loop never blocks on console I/O
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+logger.propagate = False
+
+
+@contextmanager
+def _queued_logging():
+    """Drain queued records into the root logger's handlers while active"""
+    handlers = logging.getLogger().handlers or [logging.StreamHandler()]
+    listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+
+# Source CSV columns used by the loader; each row is read positionally into a
+# CompanyRecord of stripped values
+CompanyRecord = namedtuple('CompanyRecord', [
+    'company_number', 'company_name', 'company_d_b_a',
+    'business_phone', 'business_email',
+    'mailing_address1', 'mailing_address2',
+    'mailing_city', 'mailing_state', 'mailing_zip'
+])
+
+
+@functools.cache
+def _conn_params() -> MappingProxyType:
+    """Database connection parameters, read from the environment once"""
+    return MappingProxyType({
+        'host': os.environ.get('DB_HOST', '98.85.51.253'),
+        'database': os.environ.get('DB_NAME', 'graph_db'),
+        'user': os.environ.get('DB_USER', 'graph_admin'),
+        'password': os.environ.get('DB_PASSWORD'),
+        'port': int(os.environ.get('DB_PORT', 5432))
+    })
+
+
+def _normalize_label(label: str) -> str:
+    """Normalize an entity label for exact-match deduplication"""
+    return unicodedata.normalize('NFKD', label).lower().strip()
+
+
+def _fact_key(fact: Dict) -> Tuple:
+    """Hashable identity of a propose fact, including its attributes"""
+    source_type, source_label = fact['source_entity']
+    target_type, target_label = fact['target_entity']
+    return (
+        source_type, _normalize_label(source_label),
+        fact['relationship'],
+        target_type, _normalize_label(target_label),
+        tuple(fact.get('source_attributes', {}).items()),
+        tuple(fact.get('target_attributes', {}).items())
+    )
+
 
 class IowaMotorVehicleServiceLoader:
     """
@@ -29,10 +99,13 @@ class IowaMotorVehicleServiceLoader:
     - Companies and their DBA names
     """
 
+    _SOURCE_INFO = ('Iowa Motor Vehicle Service Database', 'iowa_mvs')
+
     def __init__(self, config: dict):
         """Initialize the loader"""
         self.config = config
         self.connection = None  # Set by distributed worker
+        self._client = None  # Created on first run and reused across runs
         self.stats = {
             'total_processed': 0,
             'successful': 0,
@@ -41,9 +114,18 @@ class IowaMotorVehicleServiceLoader:
             'phones_added': 0,
             'emails_added': 0,
             'addresses_added': 0,
-            'dbas_added': 0
+            'dbas_added': 0,
+            'cache_hits': 0
         }
 
+        # Keys of facts proposed successfully this session; exact repeats
+        # (common across registry rows) skip the server round trip
+        self._seen_facts = set()
+
+        # Optionally send facts through the COPY staging table (requires the
+        # staging_facts migration) instead of multi-row statements
+        self._use_copy = config.get('processing', {}).get('use_copy', False)
+
     def run(
         self,
         file_path: str = None,
@@ -65,82 +147,220 @@ class IowaMotorVehicleServiceLoader:
         if not self.connection:
             raise ValueError("database connection not set")
 
-        # Setup real ProposeAPIClient with connection parameters
-        conn_params = {
-            'host': os.environ.get('DB_HOST', '98.85.51.253'),
-            'database': os.environ.get('DB_NAME', 'graph_db'),
-            'user': os.environ.get('DB_USER', 'graph_admin'),
-            'password': os.environ.get('DB_PASSWORD'),
-            'port': int(os.environ.get('DB_PORT', 5432))
-        }
-        client = ProposeAPIClient(conn_params)
-
-        print(f"Loading Motor Vehicle Service Contract Companies from: {file_path}")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            for i, row in enumerate(reader):
-                if limit and i >= limit:
-                    break
-
-                try:
-                    self._process_company(row, client)
-                    self.stats['successful'] += 1
-
-                except Exception as e:
-                    self.stats['failed'] += 1
-                    print(f"Error processing row {i}: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-                    if error_callback:
-                        error_callback({
-                            'source_record_id': row.get('company_number'),
-                            'issue_type': 'processing_error',
-                            'severity': 'error',
-                            'message': str(e),
-                            'raw_record': row
-                        })
-
-                self.stats['total_processed'] += 1
-
-                # Save checkpoint periodically
-                if checkpoint_callback and i % batch_size == 0:
-                    checkpoint_callback({
-                        'records_processed': self.stats['total_processed'],
-                        'last_company_number': row.get('company_number')
-                    })
-
-                # Send log update
-                if log_callback and i % 50 == 0:
-                    log_callback({
-                        'level': 'INFO',
-                        'message': f'Progress: {self.stats["total_processed"]} companies processed',
-                        'metadata': self.stats
-                    })
-
-        print(f"\nLoad Complete:")
-        print(f"  Total Processed: {self.stats['total_processed']}")
-        print(f"  Successful: {self.stats['successful']}")
-        print(f"  Failed: {self.stats['failed']}")
-        print(f"  Companies Created: {self.stats['companies_created']}")
-        print(f"  Phone Numbers Added: {self.stats['phones_added']}")
-        print(f"  Email Addresses Added: {self.stats['emails_added']}")
-        print(f"  Addresses Added: {self.stats['addresses_added']}")
-        print(f"  DBAs Added: {self.stats['dbas_added']}")
+        client = self._get_client()
+
+        with _queued_logging():
+            logger.info(f"Loading Motor Vehicle Service Contract Companies from: {file_path}")
+
+            with open(file_path, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+
+                # Resolve column positions once from the header
+                header = next(reader, [])
+                col_idx = {name: i for i, name in enumerate(header)}
+                indices = [col_idx.get(name) for name in CompanyRecord._fields]
+
+                # Rows are proposed batch_size at a time so each batch costs two
+                # batched round trips instead of up to four calls per row.
+                # Batches run one at a time: rows share cities, addresses and
+                # agents, and propose_fact() takes no lock between looking an
+                # entity up and inserting it, so concurrent batches would
+                # create duplicate nodes.
+                batch = []
+                for i, fields in enumerate(reader):
+                    if limit and i >= limit:
+                        break
+
+                    width = len(fields)
+                    row = CompanyRecord._make([
+                        fields[j].strip() if j is not None and j < width else ''
+                        for j in indices
+                    ])
+                    batch.append((i, row))
+                    if len(batch) >= batch_size:
+                        self._process_batch(batch, client, checkpoint_callback, log_callback, error_callback)
+                        batch = []
+
+                if batch:
+                    self._process_batch(batch, client, checkpoint_callback, log_callback, error_callback)
+
+            logger.info(
+                "Load Complete:\n"
+                f"  Total Processed: {self.stats['total_processed']}\n"
+                f"  Successful: {self.stats['successful']}\n"
+                f"  Failed: {self.stats['failed']}\n"
+                f"  Companies Created: {self.stats['companies_created']}\n"
+                f"  Phone Numbers Added: {self.stats['phones_added']}\n"
+                f"  Email Addresses Added: {self.stats['emails_added']}\n"
+                f"  Addresses Added: {self.stats['addresses_added']}\n"
+                f"  DBAs Added: {self.stats['dbas_added']}\n"
+                f"  Repeated Facts Skipped: {self.stats['cache_hits']}"
+            )
 
         return self.stats
 
-    def _process_company(self, row: Dict, client: ProposeAPIClient):
-        """Process a single company record using the propose API"""
-
-        company_name = row.get('company_name', '').strip()
+    def _get_client(self) -> ProposeAPIClient:
+        """Create the ProposeAPIClient (and its pool) once, on first run"""
+        if self._client is None:
+            # The client pools its connections; a batch borrows one at a time
+            processing = self.config.get('processing', {})
+            self._client = ProposeAPIClient(
+                dict(_conn_params()),
+                min_connections=processing.get('min_connections', 5),
+                max_connections=processing.get('max_connections', 25)
+            )
+        return self._client
+
+    def _propose_batch(
+        self,
+        batch: List[Tuple[int, CompanyRecord]],
+        client: ProposeAPIClient
+    ) -> Tuple[Counter, List[Tuple[int, CompanyRecord, Exception]]]:
+        """
+        Propose the facts for a batch of rows
+
+        Returns:
+            (counts, failures): stat increments for the batch and the
+            (index, row, error) of every row that failed
+        """
+        counts = Counter()
+        failures = []
+
+        # Build every row's facts first; a row that can't be built fails alone
+        planned = []
+        built = []
+        for i, row in batch:
+            try:
+                facts = self._company_facts(row)
+            except Exception as e:
+                failures.append((i, row, e))
+                continue
+
+            built.append((i, row))
+            if facts:
+                planned.append(facts)
+
+        try:
+            # Each address fact creates its company as a side effect, so the
+            # remaining facts for a company are only proposed once it exists
+            address_outcomes = self._propose_new([address_fact for address_fact, _ in planned], client, counts)
+
+            dependent = []
+            for (_, dependent_facts), outcome in zip(planned, address_outcomes):
+                if outcome is not False:
+                    dependent.extend(dependent_facts)
+                if outcome:
+                    counts['addresses_added'] += 1
+                    counts['companies_created'] += 1
+
+            dependent_outcomes = self._propose_new([fact for _, fact in dependent], client, counts)
+            for (stat, _), outcome in zip(dependent, dependent_outcomes):
+                if outcome:
+                    counts[stat] += 1
+
+            counts['successful'] += len(built)
+
+        except Exception as e:
+            failures.extend((i, row, e) for i, row in built)
+
+        return counts, failures
+
+    def _propose_new(self, facts: List[Dict], client: ProposeAPIClient, counts: Counter) -> List[Optional[bool]]:
+        """
+        Propose the facts not already proposed successfully this session
+
+        Returns:
+            Per-fact outcome: True if proposed successfully, False if the
+            proposal failed, None if skipped as a repeat (counted in
+            cache_hits)
+        """
+        outcomes = [None] * len(facts)
+        pending = []
+        for n, fact in enumerate(facts):
+            key = _fact_key(fact)
+            if key in self._seen_facts:
+                counts['cache_hits'] += 1
+            else:
+                pending.append((n, key, fact))
+
+        if pending:
+            propose = client.copy_propose_facts if self._use_copy else client.batch_propose_facts
+            results = propose([fact for _, _, fact in pending])
+            for (n, key, _), result in zip(pending, results):
+                outcomes[n] = result.success
+                if result.success:
+                    self._seen_facts.add(key)
+
+        return outcomes
+
+    def _process_batch(
+        self,
+        batch: List[Tuple[int, CompanyRecord]],
+        client: ProposeAPIClient,
+        checkpoint_callback=None,
+        log_callback=None,
+        error_callback=None
+    ):
+        """Propose a batch, fold it into the stats, then report progress"""
+
+        try:
+            counts, failures = self._propose_batch(batch, client)
+        except Exception as e:
+            counts, failures = Counter(), [(i, row, e) for i, row in batch]
+
+        for stat, count in counts.items():
+            self.stats[stat] += count
+        for i, row, error in failures:
+            self._record_failure(i, row, error, error_callback)
+
+        self.stats['total_processed'] += len(batch)
+
+        # Save checkpoint after every batch
+        if checkpoint_callback:
+            checkpoint_callback({
+                'records_processed': self.stats['total_processed'],
+                'last_company_number': batch[-1][1].company_number
+            })
+
+        # Send log update
+        if log_callback:
+            log_callback({
+                'level': 'INFO',
+                'message': f'Progress: {self.stats["total_processed"]} companies processed',
+                'metadata': self.stats
+            })
+
+    def _record_failure(self, i: int, row: CompanyRecord, error: Exception, error_callback=None):
+        """Count a failed row and report it"""
+        self.stats['failed'] += 1
+        logger.error("Error processing row %d: %s", i, error, exc_info=error)
+
+        if error_callback:
+            error_callback({
+                'source_record_id': row.company_number,
+                'issue_type': 'processing_error',
+                'severity': 'error',
+                'message': str(error),
+                'raw_record': row._asdict()
+            })
+
+    def _company_facts(self, row: CompanyRecord) -> Optional[Tuple[Dict, List[Tuple[str, Dict]]]]:
+        """
+        Build the propose facts for a single company record
+
+        Returns:
+            (address_fact, dependent_facts), where dependent_facts are
+            (stat key, fact) pairs to propose once the address fact has
+            created the company; None if the row has nothing to propose
+        """
+
+        company_name = row.company_name
         if not company_name:
-            return
+            return None
 
-        source_info = ('Iowa Motor Vehicle Service Database', 'iowa_mvs')
-        company_number = row.get('company_number', '').strip()
+        source_info = self._SOURCE_INFO
+        company_entity = ('Company', company_name)  # shared by every fact for the row
+        company_number = row.company_number
 
         # Prepare company attributes
         company_attrs = {}
@@ -152,68 +372,65 @@ class IowaMotorVehicleServiceLoader:
         # which will create both the company and address nodes.
 
         # Add mailing address - this creates the company as a side effect
-        address_created = self._add_mailing_address(company_name, row, client, source_info, company_attrs)
-
-        if address_created:
-            self.stats['companies_created'] += 1
-
-            # Add DBA if present
-            dba = row.get('company_d_b_a', '').strip()
-            if dba and dba != company_name:
-                dba_result = client.propose_fact(
-                    source_entity=('Company', company_name),
-                    target_entity=('Company', dba),
-                    relationship='Partnership',  # DBA is a form of partnership/association
-                    source_info=source_info,
-                    source_attributes={'alias_type': 'DBA'},
-                    provenance_confidence=0.95
-                )
-                if dba_result.success:
-                    self.stats['dbas_added'] += 1
-
-            # Add business phone (NEW FACT TYPE!)
-            business_phone = row.get('business_phone', '').strip()
-            if business_phone:
-                phone_result = client.propose_fact(
-                    source_entity=('Company', company_name),
-                    target_entity=('Thing', f"Phone: {business_phone}"),  # Using Thing for phone
-                    relationship='Located_At',  # Company is contactable at phone
-                    source_info=source_info,
-                    target_attributes={'phone_number': business_phone, 'contact_type': 'business'},
-                    provenance_confidence=0.95
-                )
-                if phone_result.success:
-                    self.stats['phones_added'] += 1
-
-            # Add business email (NEW FACT TYPE!)
-            business_email = row.get('business_email', '').strip()
-            if business_email:
-                email_result = client.propose_fact(
-                    source_entity=('Company', company_name),
-                    target_entity=('Thing', f"Email: {business_email}"),  # Using Thing for email
-                    relationship='Located_At',  # Company is contactable at email
-                    source_info=source_info,
-                    target_attributes={'email_address': business_email, 'contact_type': 'business'},
-                    provenance_confidence=0.95
-                )
-                if email_result.success:
-                    self.stats['emails_added'] += 1
-
-    def _add_mailing_address(self, company_name: str, row: Dict, client: ProposeAPIClient, source_info: tuple, company_attrs: Dict = None):
-        """Create and link mailing address for the company"""
-
-        address1 = row.get('mailing_address1', '').strip()
-        city = row.get('mailing_city', '').strip()
-        state = row.get('mailing_state', '').strip()
-        zip_code = row.get('mailing_zip', '').strip()
+        address_fact = self._mailing_address_fact(company_entity, row, source_info, company_attrs)
+        if not address_fact:
+            return None
+
+        dependent_facts = []
+
+        # Add DBA if present
+        dba = row.company_d_b_a
+        if dba and dba != company_name:
+            dependent_facts.append(('dbas_added', {
+                'source_entity': company_entity,
+                'target_entity': ('Company', dba),
+                'relationship': 'Partnership',  # DBA is a form of partnership/association
+                'source_info': source_info,
+                'source_attributes': {'alias_type': 'DBA'},
+                'provenance_confidence': 0.95
+            }))
+
+        # Add business phone (NEW FACT TYPE!)
+        business_phone = row.business_phone
+        if business_phone:
+            dependent_facts.append(('phones_added', {
+                'source_entity': company_entity,
+                'target_entity': ('Thing', "Phone: " + business_phone),  # Using Thing for phone
+                'relationship': 'Located_At',  # Company is contactable at phone
+                'source_info': source_info,
+                'target_attributes': {'phone_number': business_phone, 'contact_type': 'business'},
+                'provenance_confidence': 0.95
+            }))
+
+        # Add business email (NEW FACT TYPE!)
+        business_email = row.business_email
+        if business_email:
+            dependent_facts.append(('emails_added', {
+                'source_entity': company_entity,
+                'target_entity': ('Thing', "Email: " + business_email),  # Using Thing for email
+                'relationship': 'Located_At',  # Company is contactable at email
+                'source_info': source_info,
+                'target_attributes': {'email_address': business_email, 'contact_type': 'business'},
+                'provenance_confidence': 0.95
+            }))
+
+        return address_fact, dependent_facts
+
+    def _mailing_address_fact(self, company_entity: Tuple[str, str], row: CompanyRecord, source_info: tuple, company_attrs: Dict = None) -> Optional[Dict]:
+        """Build the fact linking the company to its mailing address"""
+
+        address1 = row.mailing_address1
+        city = row.mailing_city
+        state = row.mailing_state
+        zip_code = row.mailing_zip
 
         if not (address1 and city and state):
-            return False
+            return None
 
         # Construct full address string
         address_parts = [address1]
 
-        address2 = row.get('mailing_address2', '').strip()
+        address2 = row.mailing_address2
         if address2:
             address_parts.append(address2)
 
@@ -231,27 +448,23 @@ class IowaMotorVehicleServiceLoader:
         if zip_code:
             address_attrs['zip'] = zip_code
 
-        address_result = client.propose_fact(
-            source_entity=('Company', company_name),
-            target_entity=('Address', full_address),
-            relationship='Located_At',
-            source_info=source_info,
-            source_attributes=company_attrs or {},  # Include company attributes here
-            target_attributes=address_attrs,
-            provenance_confidence=0.95
-        )
-
-        if address_result.success:
-            self.stats['addresses_added'] += 1
-            return True
-
-        return False
+        return {
+            'source_entity': company_entity,
+            'target_entity': ('Address', full_address),
+            'relationship': 'Located_At',
+            'source_info': source_info,
+            'source_attributes': company_attrs or {},  # Include company attributes here
+            'target_attributes': address_attrs,
+            'provenance_confidence': 0.95
+        }
 
 
 if __name__ == '__main__':
     # For local testing
     import psycopg2
 
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     loader = IowaMotorVehicleServiceLoader({
         'input': {
             'file_path': './jobs/iowa_motor_vehicle_service/data/motor_vehicle_service_companies.csv'
@@ -5,7 +5,11 @@ Download Iowa Business Entities data from Iowa.gov
 
 import os
 import sys
+import time
+import zlib
 import logging
+import http.client
+import urllib.error
 import urllib.request
 from datetime import datetime
 
@@ -16,6 +20,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Response bytes read (and written) per iteration
+CHUNK_SIZE = 1 << 20
+
+# Minimum seconds between progress line updates
+PROGRESS_INTERVAL = 0.1
+
+# Interrupted downloads are resumed from the partial file this many times
+MAX_ATTEMPTS = 5
+
+
+def count_newlines(path):
+    """Count newlines in a file, reading it in binary chunks"""
+    with open(path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(CHUNK_SIZE), b''))
+
+
+def show_progress(received, total_size):
+    """Rewrite the progress line in place"""
+    if total_size:
+        percent = min(received * 100 / total_size, 100)
+        sys.stdout.write(f"\rDownloading: {percent:.1f}% [{received:,}/{total_size:,} bytes]")
+    else:
+        sys.stdout.write(f"\rDownloading: {received:,} bytes")
+    sys.stdout.flush()
+
+
+def fetch_to_file(url, part_file):
+    """
+    Stream url into part_file, resuming from whatever is already on disk
+    
+    A fresh download asks for gzip (the CSV compresses well) and decodes it
+    while writing; a resumed one asks for the remaining identity bytes with a
+    Range header, since the partial file holds decoded data.
+    
+    Returns:
+        Number of newlines in the completed file, counted as it is written
+    """
+    offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else {'Accept-Encoding': 'gzip'}
+    
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=60) as response:
+        if offset and response.status != 206:
+            # Server ignored the Range header; start over
+            offset = 0
+        newlines = count_newlines(part_file) if offset else 0
+        
+        decoder = None
+        if response.headers.get('Content-Encoding') == 'gzip':
+            decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        length = response.headers.get('Content-Length')
+        total_size = int(length) if length else 0
+        received = 0
+        last_progress = 0.0
+        
+        with open(part_file, 'ab' if offset else 'wb') as f:
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                received += len(chunk)
+                if decoder:
+                    chunk = decoder.decompress(chunk)
+                newlines += chunk.count(b'\n')
+                f.write(chunk)
+                
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL:
+                    show_progress(received, total_size)
+                    last_progress = now
+            
+            show_progress(received, total_size)
+            
+            if decoder:
+                tail = decoder.flush()
+                newlines += tail.count(b'\n')
+                f.write(tail)
+        
+        # A dropped connection can end the body early without an error
+        if (total_size and received < total_size) or (decoder and not decoder.eof):
+            raise http.client.IncompleteRead(b'', total_size - received if total_size else None)
+    
+    return newlines
+
+
 def download_iowa_data():
     """Download the Iowa business entities CSV from data.iowa.gov"""
     
@@ -33,23 +122,32 @@ def download_iowa_data():
     logger.info(f"Output: {output_file}")
     
     try:
-        # Download with progress
-        def download_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(downloaded * 100 / total_size, 100)
-            sys.stdout.write(f"\rDownloading: {percent:.1f}% [{downloaded:,}/{total_size:,} bytes]")
-            sys.stdout.flush()
-        
-        urllib.request.urlretrieve(url, output_file, download_progress)
+        # Download into a .part file, resuming after network errors, and only
+        # move it into place once complete
+        part_file = output_file + '.part'
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                newlines = fetch_to_file(url, part_file)
+                break
+            except (OSError, http.client.HTTPException) as e:
+                if isinstance(e, urllib.error.HTTPError) and e.code == 416:
+                    # Nothing left to fetch: the partial file is complete
+                    newlines = count_newlines(part_file)
+                    break
+                if attempt == MAX_ATTEMPTS:
+                    raise
+                print()
+                logger.warning(f"Download interrupted ({e}); resuming (attempt {attempt + 1}/{MAX_ATTEMPTS})")
+                time.sleep(2 ** attempt)
         print()  # New line after progress
+        os.replace(part_file, output_file)
         
         # Check file size
         file_size = os.path.getsize(output_file)
         logger.info(f"✅ Download complete! File size: {file_size:,} bytes")
         
-        # Count records
-        with open(output_file, 'r') as f:
-            record_count = sum(1 for _ in f) - 1  # Subtract header
+        # Records were counted while downloading
+        record_count = newlines - 1  # Subtract header
         
         logger.info(f"📊 Total records: {record_count:,}")
         logger.info(f"📁 File saved to: {output_file}")
@@ -5,31 +5,31 @@ This is a temporary solution - AWS Aurora IPs can change
 """
 
 import os
+import shutil
 import socket
-import subprocess
+import time
 
 # RDS endpoint
 RDS_ENDPOINT = "six-worker-cluster.cluster-cg56igkg8ibw.us-east-1.rds.amazonaws.com"
 
+# Resolved IPs are reused for this many seconds (Aurora IPs can change)
+DNS_CACHE_TTL = 60
+
+_cached_ip = None
+_cached_at = 0.0
+
 def get_rds_ip():
     """Get current IP for RDS endpoint"""
+    global _cached_ip, _cached_at
+    
+    now = time.monotonic()
+    if _cached_ip and now - _cached_at < DNS_CACHE_TTL:
+        return _cached_ip
+    
     try:
-        # Try Google DNS
-        result = subprocess.run(
-            ['nslookup', RDS_ENDPOINT, '8.8.8.8'],
-            capture_output=True,
-            text=True
-        )
-        
-        # Parse the IP from output
-        for line in result.stdout.split('\n'):
-            if 'Address:' in line and '#' not in line:
-                ip = line.split('Address:')[1].strip()
-                if ip and '.' in ip:
-                    return ip
-        
-        # Fallback to socket resolution
-        return socket.gethostbyname(RDS_ENDPOINT)
+        addrs = socket.getaddrinfo(RDS_ENDPOINT, 5432, socket.AF_INET, socket.SOCK_STREAM)
+        _cached_ip, _cached_at = addrs[0][4][0], now
+        return _cached_ip
     except Exception as e:
         print(f"Error resolving {RDS_ENDPOINT}: {e}")
         return None
@@ -51,24 +51,32 @@ def update_connection_files():
     ]
     
     for filepath in files_to_update:
-        if os.path.exists(filepath):
-            print(f"Updating {filepath}...")
+        # Scan first: files that don't mention the endpoint get no backup
+        # and no rewrite
+        try:
             with open(filepath, 'r') as f:
-                content = f.read()
-            
-            # Create backup
-            with open(f"{filepath}.backup", 'w') as f:
-                f.write(content)
-            
-            # Replace endpoint with IP
-            updated = content.replace(RDS_ENDPOINT, ip)
-            
-            if updated != content:
-                with open(filepath, 'w') as f:
-                    f.write(updated)
-                print(f"  Updated {filepath} to use IP {ip}")
-            else:
-                print(f"  No changes needed for {filepath}")
+                mentions_endpoint = any(RDS_ENDPOINT in line for line in f)
+        except FileNotFoundError:
+            continue
+        print(f"Updating {filepath}...")
+        
+        if not mentions_endpoint:
+            print(f"  No changes needed for {filepath}")
+            continue
+        
+        # Create backup
+        shutil.copyfile(filepath, f"{filepath}.backup")
+        
+        # Replace endpoint with IP line by line into a temp file, then
+        # swap it in
+        tmp_path = f"{filepath}.tmp"
+        with open(filepath, 'r') as src, open(tmp_path, 'w') as dst:
+            for line in src:
+                dst.write(line.replace(RDS_ENDPOINT, ip) if RDS_ENDPOINT in line else line)
+        
+        shutil.copymode(filepath, tmp_path)  # keep run_sql.sh executable
+        os.replace(tmp_path, filepath)
+        print(f"  Updated {filepath} to use IP {ip}")
     
     return True
 
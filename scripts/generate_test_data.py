@@ -11,43 +11,68 @@ This script uses an LLM to generate realistic test scenarios including:
 
 Usage:
     python scripts/generate_test_data.py --scenarios 10 --output db/test-data/generated_test_data.sql
+    python scripts/generate_test_data.py --scenarios 200 --batch   # via the Message Batches API
+    python scripts/generate_test_data.py --scenarios 10 --no-cache # always call the API
 """
 
+import asyncio
+import hashlib
 import json
-import uuid
+import logging
+import sqlite3
 import random
 import time
-import math
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, date
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import argparse
 import sys
 import os
 
 try:
-    import anthropic
-except ImportError:
-    print("Error: anthropic library not installed. Install with: pip install anthropic")
-    sys.exit(1)
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
 
+logger = logging.getLogger("testgen")
 
-class TestDataGenerator:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the test data generator with Anthropic API key."""
-        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
-        if not self.api_key:
-            raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY environment variable or pass api_key parameter.")
-        
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.entities = []
-        self.relationships = []
-        self.attributes = []
-        self.conflict_matrix = []
-        
-    def generate_scenario_prompt(self, scenario_type: str) -> str:
-        """Generate prompts for different types of law firm scenarios."""
-        
-        base_prompt = """You are generating realistic test data for a law firm conflict checking system. 
+# Crockford Base32 alphabet (excludes I, L, O, U) and the bit offset of each of the 26 ULID characters
+ULID_ENCODING = b"0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ULID_SHIFTS = tuple(range(125, -1, -5))
+
+MODEL = "claude-3-5-sonnet-20241022"
+TEMPERATURE = 0.8
+
+# SQLite file holding previously generated scenarios, so re-runs don't pay for the same requests again
+LLM_CACHE_PATH = ".llm_cache.sqlite"
+
+SCENARIO_TYPES = ["law_firm", "corporate_client", "family_business",
+                  "litigation_matter", "merger_acquisition", "real_estate"]
+
+# Requests in flight at once when not using the batch API
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds between status checks while a message batch is processing
+BATCH_POLL_INTERVAL = 10
+
+# Random dates drawn at once whenever a date range's pool runs dry
+DATE_POOL_SIZE = 1024
+
+# Rows per multi-row INSERT statement in the SQL output
+INSERT_BATCH_SIZE = 500
+
+# Column lists and precompiled VALUES-tuple templates for the SQL output
+NODE_COLUMNS = "node_id, node_type, primary_name, created_by"
+NODE_ROW = "('{}', '{}', '{}', '{}')"
+ATTRIBUTE_COLUMNS = "node_id, attribute_type, attribute_value, confidence, source"
+ATTRIBUTE_ROW = "('{}', '{}', '{}', {}, '{}')"
+RELATIONSHIP_COLUMNS = "source_node_id, target_node_id, relationship_type, strength, valid_from, valid_to, metadata"
+RELATIONSHIP_ROW = "('{}', '{}', '{}', {}, '{}', {}, {})"
+
+# Static prompt prefix. It is sent as a separate content block marked for prompt caching,
+# so it must stay byte-identical across calls.
+BASE_PROMPT = """You are generating realistic test data for a law firm conflict checking system. 
         Create a detailed scenario with specific names, companies, relationships, and potential conflicts.
         
         Include:
@@ -59,386 +84,564 @@ class TestDataGenerator:
         - Potential conflict situations
         - Time periods for relationships (start/end dates)
         
-        Format your response as structured data that can be parsed."""
+        Report the scenario by calling the emit_scenario tool."""
+
+# Scenario-specific prompt text, appended after BASE_PROMPT
+SCENARIO_PROMPTS = {
+    "law_firm": """
+    Create a mid-sized law firm scenario with:
+    - Law firm name and 5-8 attorneys (partners, associates, counsel)
+    - Support staff (paralegals, administrators)
+    - Practice areas and specializations
+    - Office locations
+    - Professional relationships and hierarchies
+    """,
+    
+    "corporate_client": """
+    Create a corporate client scenario with:
+    - Company name and industry
+    - Executive team (CEO, CFO, CTO, etc.)
+    - Board of directors
+    - Key employees in different departments
+    - Corporate structure (subsidiaries, parent companies)
+    - Business relationships with other entities
+    """,
+    
+    "family_business": """
+    Create a family business scenario with:
+    - Family-owned company with multiple generations
+    - Family members in various roles
+    - Family relationships (spouses, children, siblings, cousins)
+    - Business ownership structures
+    - Potential succession issues
+    - External business partners
+    """,
+    
+    "litigation_matter": """
+    Create a complex litigation scenario with:
+    - Multiple parties (plaintiffs, defendants)
+    - Law firms representing different sides
+    - Corporate entities involved
+    - Individual executives and employees
+    - Insurance companies
+    - Expert witnesses
+    - Court jurisdiction and case details
+    """,
+    
+    "merger_acquisition": """
+    Create a merger & acquisition scenario with:
+    - Acquiring company and target company
+    - Investment banks and advisors
+    - Legal counsel for each side
+    - Regulatory bodies
+    - Key executives involved
+    - Due diligence teams
+    - Potential conflicts of interest
+    """,
+    
+    "real_estate": """
+    Create a commercial real estate scenario with:
+    - Property developers and investors
+    - Real estate companies and brokers
+    - Construction companies and contractors
+    - Financing institutions and lenders
+    - Local government entities
+    - Environmental consultants
+    - Property management companies
+    """
+}
+
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+# Forced tool call that makes the model return the scenario as JSON matching this schema
+SCENARIO_TOOL = {
+    "name": "emit_scenario",
+    "description": "Record the generated scenario's firms, companies, people, relationships and conflicts.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "law_firms": {"type": "array", "items": {
+                "type": "object",
+                "properties": {
+                    "name": _STRING,
+                    "attorneys": {"type": "array", "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": _STRING,
+                            "title": {"type": "string", "description": "Partner/Associate/Counsel"},
+                            "aliases": _STRING_LIST,
+                            "specialization": {"type": "string", "description": "Practice area"}
+                        },
+                        "required": ["name", "title"]
+                    }}
+                },
+                "required": ["name", "attorneys"]
+            }},
+            "companies": {"type": "array", "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Company name with legal suffix"},
+                    "industry": _STRING,
+                    "employees": {"type": "array", "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": _STRING,
+                            "title": {"type": "string", "description": "CEO/CFO/etc"},
+                            "aliases": _STRING_LIST
+                        },
+                        "required": ["name", "title"]
+                    }}
+                },
+                "required": ["name", "employees"]
+            }},
+            "relationships": {"type": "array", "items": {
+                "type": "object",
+                "properties": {
+                    "source": {"type": "string", "description": "Person/Company name"},
+                    "target": {"type": "string", "description": "Person/Company name"},
+                    "type": {"type": "string", "description": "Employment/Family/Legal_Counsel/etc"},
+                    "strength": {"type": "number", "minimum": 0, "maximum": 1},
+                    "start_date": {"type": "string", "description": "YYYY-MM-DD"},
+                    "end_date": {"type": ["string", "null"], "description": "YYYY-MM-DD or null"}
+                },
+                "required": ["source", "target", "type"]
+            }},
+            "conflicts": {"type": "array", "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string", "description": "Why this is a conflict"},
+                    "entities": _STRING_LIST,
+                    "conflict_type": _STRING
+                },
+                "required": ["description", "entities"]
+            }}
+        },
+        "required": ["law_firms", "companies", "relationships", "conflicts"]
+    }
+}
+
+
+
+def dumps_json(value: Any) -> str:
+    """Encode a value as a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def escape_column(values: List[str]) -> List[str]:
+    """Double single quotes across a whole column of SQL string values in one pass."""
+    return [value.replace("'", "''") for value in values]
+
+
+def literal_or_null(value: Optional[str]) -> str:
+    """Quote a value as a SQL string literal, or NULL when empty."""
+    return f"'{value}'" if value else "NULL"
+
+
+@lru_cache(maxsize=None)
+def date_strings(start_year: int, end_year: int) -> Tuple[str, ...]:
+    """Every date from Jan 1 of start_year through Dec 31 of end_year, as ISO strings."""
+    first, last = date(start_year, 1, 1).toordinal(), date(end_year, 12, 31).toordinal()
+    return tuple(date.fromordinal(day).isoformat() for day in range(first, last + 1))
+
+
+class TestDataGenerator:
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[str] = LLM_CACHE_PATH,
+                 cache_seed: str = ""):
+        """Initialize the test data generator with Anthropic API key.
         
-        scenario_prompts = {
-            "law_firm": """
-            Create a mid-sized law firm scenario with:
-            - Law firm name and 5-8 attorneys (partners, associates, counsel)
-            - Support staff (paralegals, administrators)
-            - Practice areas and specializations
-            - Office locations
-            - Professional relationships and hierarchies
-            """,
-            
-            "corporate_client": """
-            Create a corporate client scenario with:
-            - Company name and industry
-            - Executive team (CEO, CFO, CTO, etc.)
-            - Board of directors
-            - Key employees in different departments
-            - Corporate structure (subsidiaries, parent companies)
-            - Business relationships with other entities
-            """,
-            
-            "family_business": """
-            Create a family business scenario with:
-            - Family-owned company with multiple generations
-            - Family members in various roles
-            - Family relationships (spouses, children, siblings, cousins)
-            - Business ownership structures
-            - Potential succession issues
-            - External business partners
-            """,
-            
-            "litigation_matter": """
-            Create a complex litigation scenario with:
-            - Multiple parties (plaintiffs, defendants)
-            - Law firms representing different sides
-            - Corporate entities involved
-            - Individual executives and employees
-            - Insurance companies
-            - Expert witnesses
-            - Court jurisdiction and case details
-            """,
-            
-            "merger_acquisition": """
-            Create a merger & acquisition scenario with:
-            - Acquiring company and target company
-            - Investment banks and advisors
-            - Legal counsel for each side
-            - Regulatory bodies
-            - Key executives involved
-            - Due diligence teams
-            - Potential conflicts of interest
-            """,
-            
-            "real_estate": """
-            Create a commercial real estate scenario with:
-            - Property developers and investors
-            - Real estate companies and brokers
-            - Construction companies and contractors
-            - Financing institutions and lenders
-            - Local government entities
-            - Environmental consultants
-            - Property management companies
-            """
+        cache_path=None disables the response cache; cache_seed namespaces it so a fresh seed
+        gets fresh samples while still replaying on later runs with the same seed.
+        """
+        self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        if not self.api_key:
+            raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY environment variable or pass api_key parameter.")
+        
+        # Imported here rather than at module level so --help doesn't need it
+        try:
+            import anthropic
+        except ImportError:
+            print("Error: anthropic library not installed. Install with: pip install anthropic")
+            sys.exit(1)
+        self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Collected rows are stored column-wise: one list per column, rows aligned by index
+        self.entities: Dict[str, list] = {
+            "node_id": [], "node_type": [], "primary_name": [], "created_by": []
+        }
+        self.relationships: Dict[str, list] = {
+            "source_node_id": [], "target_node_id": [], "relationship_type": [], "strength": [],
+            "valid_from": [], "valid_to": [], "metadata": []
+        }
+        self.attributes: Dict[str, list] = {
+            "node_id": [], "attribute_type": [], "attribute_value": [], "confidence": [], "source": []
         }
+        self._date_pools: Dict[Tuple[int, int], List[str]] = {}
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
         
-        return base_prompt + scenario_prompts.get(scenario_type, scenario_prompts["corporate_client"])
+        self._cache = sqlite3.connect(cache_path) if cache_path else None
+        if self._cache is not None:
+            self._cache.execute("CREATE TABLE IF NOT EXISTS llm_cache(k TEXT PRIMARY KEY, v BLOB)")
+        self._cache_seed = cache_seed
+        self._prompt_uses: Dict[str, int] = {}
+        self.cache_hits = 0
+        
+    def generate_scenario_prompt(self, scenario_type: str) -> str:
+        """Scenario-specific part of the prompt; it is sent after the cached BASE_PROMPT."""
+        return SCENARIO_PROMPTS.get(scenario_type, SCENARIO_PROMPTS["corporate_client"])
     
-    def call_llm(self, prompt: str) -> str:
-        """Make API call to Anthropic Claude."""
+    def message_params(self, prompt: str) -> Dict[str, Any]:
+        """Request parameters for a single prompt, shared by direct and batch calls."""
+        # The shared prefix goes first with a cache breakpoint so the server can reuse it across calls;
+        # the forced tool call makes the whole reply the scenario JSON
+        return {
+            "model": MODEL,
+            "max_tokens": 4096,
+            "temperature": TEMPERATURE,
+            "tools": [SCENARIO_TOOL],
+            "tool_choice": {"type": "tool", "name": SCENARIO_TOOL["name"]},
+            "messages": [{"role": "user", "content": [
+                {"type": "text", "text": BASE_PROMPT, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt}
+            ]}]
+        }
+    
+    def scenario_input(self, message) -> Optional[Dict[str, Any]]:
+        """The already-parsed emit_scenario tool input from a reply, or None if the model didn't call it."""
+        for block in message.content:
+            if block.type == "tool_use" and block.name == SCENARIO_TOOL["name"]:
+                return block.input
+        logger.warning("LLM reply did not include an emit_scenario call")
+        return None
+    
+    def record_usage(self, message) -> None:
+        """Accumulate token usage, including prompt-cache reads, for the end-of-run summary."""
+        usage = message.usage
+        self.input_tokens += usage.input_tokens
+        self.cache_read_tokens += getattr(usage, "cache_read_input_tokens", None) or 0
+    
+    def cache_key(self, prompt: str) -> str:
+        """Cache key for the next request of this prompt in the current run.
+        
+        The key covers the full request parameters (model, temperature, tool schema, prompt text) and
+        counts repeats of the same prompt, so the n-th request for a scenario type replays the n-th
+        stored response instead of every repeat returning the same scenario.
+        """
+        use = self._prompt_uses.get(prompt, 0)
+        self._prompt_uses[prompt] = use + 1
+        params = json.dumps(self.message_params(prompt), sort_keys=True)
+        return hashlib.blake2b(f"{self._cache_seed}|{use}|{params}".encode(), digest_size=16).hexdigest()
+    
+    def cached_scenario(self, key: str) -> Optional[Dict[str, Any]]:
+        """A previously stored scenario for this key, or None."""
+        if self._cache is None:
+            return None
+        row = self._cache.execute("SELECT v FROM llm_cache WHERE k = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.cache_hits += 1
+        return json.loads(row[0])
+    
+    def store_scenario(self, key: str, scenario: Optional[Dict[str, Any]]) -> None:
+        """Persist a successful scenario under its key; failures are not cached."""
+        if self._cache is None or scenario is None:
+            return
+        with self._cache:
+            self._cache.execute("INSERT OR REPLACE INTO llm_cache(k, v) VALUES (?, ?)", (key, dumps_json(scenario)))
+    
+    async def call_llm(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Make API call to Anthropic Claude and return the scenario it emitted."""
+        key = self.cache_key(prompt)
+        scenario = self.cached_scenario(key)
+        if scenario is not None:
+            return scenario
         try:
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                temperature=0.8,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
+            async with self._request_slots:
+                response = await self.client.messages.create(**self.message_params(prompt))
+            self.record_usage(response)
+            scenario = self.scenario_input(response)
+            self.store_scenario(key, scenario)
+            return scenario
         except Exception as e:
-            print(f"Error calling LLM: {e}")
-            return ""
+            logger.error("Error calling LLM: %s", e)
+            return None
     
-    def parse_llm_response(self, response: str) -> Dict[str, Any]:
-        """Parse LLM response and extract structured data."""
-        # This is a simplified parser - in production, you'd want more robust parsing
-        # For now, we'll use a structured prompt to get JSON-like responses
-        
-        parsing_prompt = f"""
-        Extract the following information from this scenario and format as JSON:
+    async def call_llm_batch(self, prompts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Run prompts through the Message Batches API; returns scenarios in prompt order (None on failure).
         
-        {{
-            "law_firms": [
-                {{
-                    "name": "Firm Name",
-                    "attorneys": [
-                        {{
-                            "name": "Full Name",
-                            "title": "Partner/Associate/Counsel",
-                            "aliases": ["Nickname", "Initials"],
-                            "specialization": "Practice area"
-                        }}
-                    ]
-                }}
-            ],
-            "companies": [
-                {{
-                    "name": "Company Name Inc",
-                    "industry": "Industry",
-                    "employees": [
-                        {{
-                            "name": "Full Name",
-                            "title": "CEO/CFO/etc",
-                            "aliases": ["Nickname"]
-                        }}
-                    ]
-                }}
-            ],
-            "relationships": [
-                {{
-                    "source": "Person/Company Name",
-                    "target": "Person/Company Name", 
-                    "type": "Employment/Family/Legal_Counsel/etc",
-                    "strength": 0.9,
-                    "start_date": "2020-01-01",
-                    "end_date": null
-                }}
-            ],
-            "conflicts": [
-                {{
-                    "description": "Why this is a conflict",
-                    "entities": ["Entity 1", "Entity 2"],
-                    "conflict_type": "Type of conflict"
-                }}
-            ]
-        }}
-        
-        Original scenario:
-        {response}
+        Prompts with a cached response are answered locally and left out of the batch.
         """
-        
-        parsed_response = self.call_llm(parsing_prompt)
-        
+        keys = [self.cache_key(prompt) for prompt in prompts]
+        scenarios: List[Optional[Dict[str, Any]]] = [self.cached_scenario(key) for key in keys]
+        pending = [i for i, scenario in enumerate(scenarios) if scenario is None]
+        if not pending:
+            return scenarios
         try:
-            # Try to extract JSON from the response
-            start = parsed_response.find('{')
-            end = parsed_response.rfind('}') + 1
-            if start >= 0 and end > start:
-                json_str = parsed_response[start:end]
-                return json.loads(json_str)
-        except json.JSONDecodeError:
-            print("Warning: Could not parse LLM response as JSON")
+            batch = await self.client.messages.batches.create(requests=[
+                {"custom_id": f"prompt-{i}", "params": self.message_params(prompts[i])}
+                for i in pending
+            ])
+            logger.info("  Submitted batch %s with %d requests", batch.id, len(pending))
+            while batch.processing_status != "ended":
+                await asyncio.sleep(BATCH_POLL_INTERVAL)
+                batch = await self.client.messages.batches.retrieve(batch.id)
             
-        return {"law_firms": [], "companies": [], "relationships": [], "conflicts": []}
+            async for entry in await self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    self.record_usage(entry.result.message)
+                    i = int(entry.custom_id.rsplit("-", 1)[1])
+                    scenarios[i] = self.scenario_input(entry.result.message)
+                    self.store_scenario(keys[i], scenarios[i])
+                else:
+                    logger.error("Error calling LLM: batch request %s %s", entry.custom_id, entry.result.type)
+            return scenarios
+        except Exception as e:
+            logger.error("Error calling LLM: %s", e)
+            return scenarios
     
     def generate_ulid(self) -> str:
         """Generate a ULID (Universally Unique Lexicographically Sortable Identifier)."""
         # ULID format: 10 characters timestamp + 16 characters randomness
         # Timestamp: milliseconds since Unix epoch in Crockford Base32
         # Randomness: 80 bits of randomness in Crockford Base32
-        
-        # Crockford Base32 alphabet (excludes I, L, O, U to avoid confusion)
-        ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
-        
-        # Get current timestamp in milliseconds
-        timestamp = int(time.time() * 1000)
-        
-        # Encode timestamp (48 bits)
-        time_part = ""
-        for _ in range(10):
-            time_part = ENCODING[timestamp % 32] + time_part
-            timestamp //= 32
-        
-        # Generate random part (80 bits)
-        random_part = ""
-        for _ in range(16):
-            random_part += ENCODING[random.randint(0, 31)]
-        
-        return time_part + random_part
-    
-    def generate_uuid(self) -> str:
-        """Generate a UUID string (keeping for backward compatibility)."""
-        return str(uuid.uuid4())
-    
-    def normalize_name(self, name: str) -> str:
-        """Normalize name for database storage."""
-        return name.lower().strip()
+        value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10), "big")
+        return bytes([ULID_ENCODING[(value >> shift) & 31] for shift in ULID_SHIFTS]).decode("ascii")
     
     def generate_random_date(self, start_year: int = 2018, end_year: int = 2024) -> str:
         """Generate a random date within the given range."""
-        start_date = date(start_year, 1, 1)
-        end_date = date(end_year, 12, 31)
-        delta = end_date - start_date
-        random_days = random.randint(0, delta.days)
-        return str(start_date + timedelta(days=random_days))
+        # Dates are drawn DATE_POOL_SIZE at a time per range and handed out one by one
+        pool = self._date_pools.get((start_year, end_year))
+        if not pool:
+            pool = self._date_pools[start_year, end_year] = random.choices(
+                date_strings(start_year, end_year), k=DATE_POOL_SIZE
+            )
+        return pool.pop()
     
     def create_entity(self, entity_type: str, name: str, created_by: str = "test_generator") -> str:
         """Create a new entity and return its ULID."""
         entity_id = self.generate_ulid()
         
-        entity = {
-            "node_id": entity_id,
-            "node_type": entity_type,
-            "primary_name": name,
-            "created_by": created_by
-        }
-        
-        self.entities.append(entity)
+        entities = self.entities
+        entities["node_id"].append(entity_id)
+        entities["node_type"].append(entity_type)
+        entities["primary_name"].append(name)
+        entities["created_by"].append(created_by)
         return entity_id
     
     def create_attribute(self, node_id: str, attr_type: str, value: str, 
                         confidence: float = 1.0, source: str = "generated"):
         """Create an attribute for an entity."""
-        attribute = {
-            "node_id": node_id,
-            "attribute_type": attr_type,
-            "attribute_value": value,
-            "confidence": confidence,
-            "source": source
-        }
-        self.attributes.append(attribute)
+        attributes = self.attributes
+        attributes["node_id"].append(node_id)
+        attributes["attribute_type"].append(attr_type)
+        attributes["attribute_value"].append(value)
+        attributes["confidence"].append(confidence)
+        attributes["source"].append(source)
     
     def create_relationship(self, source_id: str, target_id: str, rel_type: str,
                           strength: float = 1.0, start_date: str = None, end_date: str = None,
                           metadata: Dict = None):
         """Create a relationship between two entities."""
-        relationship = {
-            "source_node_id": source_id,
-            "target_node_id": target_id,
-            "relationship_type": rel_type,
-            "strength": strength,
-            "valid_from": start_date or date.today().isoformat(),
-            "valid_to": end_date,
-            "metadata": json.dumps(metadata) if metadata else None
-        }
-        self.relationships.append(relationship)
+        relationships = self.relationships
+        relationships["source_node_id"].append(source_id)
+        relationships["target_node_id"].append(target_id)
+        relationships["relationship_type"].append(rel_type)
+        relationships["strength"].append(strength)
+        relationships["valid_from"].append(start_date or date.today().isoformat())
+        relationships["valid_to"].append(end_date)
+        relationships["metadata"].append(dumps_json(metadata) if metadata else None)
+    
+    def add_person(self, *, name: str, title: str, aliases: List[str], specialization: Optional[str],
+                   employer_id: str, strength: float, start_date: str, person_id: Optional[str] = None) -> str:
+        """Add a person with their title/alias/specialization attributes and employment in one pass.
+        
+        Writes straight into the columns instead of going through create_entity/create_attribute/
+        create_relationship per row. Pass person_id to attach to an existing entity instead of creating one.
+        """
+        if person_id is None:
+            person_id = self.generate_ulid()
+            entities = self.entities
+            entities["node_id"].append(person_id)
+            entities["node_type"].append("Person")
+            entities["primary_name"].append(name)
+            entities["created_by"].append("test_generator")
+        
+        # Attribute order matches the per-row path: title, aliases, then specialization
+        attribute_types = ["title"] + ["nameAlias"] * len(aliases)
+        attribute_values = [title, *aliases]
+        if specialization:
+            attribute_types.append("category")
+            attribute_values.append(specialization)
+        count = len(attribute_values)
+        attributes = self.attributes
+        attributes["node_id"].extend([person_id] * count)
+        attributes["attribute_type"].extend(attribute_types)
+        attributes["attribute_value"].extend(attribute_values)
+        attributes["confidence"].extend([1.0] * count)
+        attributes["source"].extend(["generated"] * count)
+        
+        relationships = self.relationships
+        relationships["source_node_id"].append(person_id)
+        relationships["target_node_id"].append(employer_id)
+        relationships["relationship_type"].append("Employment")
+        relationships["strength"].append(strength)
+        relationships["valid_from"].append(start_date)
+        relationships["valid_to"].append(None)
+        relationships["metadata"].append(None)
+        return person_id
     
     def process_scenario_data(self, scenario_data: Dict[str, Any]) -> None:
         """Process parsed scenario data and create entities/relationships."""
-        entity_map = {}  # Map names to UUIDs
+        # Map names to ULIDs. Names are interned as they are read, so the entity_map keys and the
+        # primary_name column share one string per name and repeat lookups hit on identity
+        entity_map = {}
         
         # Create law firms and attorneys
         for firm_data in scenario_data.get("law_firms", []):
-            firm_id = self.create_entity("Company", firm_data["name"])
-            entity_map[firm_data["name"]] = firm_id
+            firm_name = sys.intern(firm_data["name"])
+            firm_id = self.create_entity("Company", firm_name)
+            entity_map[firm_name] = firm_id
             
             for attorney in firm_data.get("attorneys", []):
-                attorney_id = self.create_entity("Person", attorney["name"])
-                entity_map[attorney["name"]] = attorney_id
-                
-                # Add attributes
-                self.create_attribute(attorney_id, "title", attorney.get("title", "Attorney"))
-                for alias in attorney.get("aliases", []):
-                    self.create_attribute(attorney_id, "nameAlias", alias)
-                
-                if attorney.get("specialization"):
-                    self.create_attribute(attorney_id, "category", attorney["specialization"])
-                
-                # Create employment relationship
-                self.create_relationship(
-                    attorney_id, firm_id, "Employment", 
+                attorney_name = sys.intern(attorney["name"])
+                entity_map[attorney_name] = self.add_person(
+                    name=attorney_name,
+                    title=attorney.get("title", "Attorney"),
+                    aliases=attorney.get("aliases", []),
+                    specialization=attorney.get("specialization"),
+                    employer_id=firm_id,
                     strength=0.9 if "Partner" in attorney.get("title", "") else 0.8,
                     start_date=self.generate_random_date(2015, 2023)
                 )
         
         # Create companies and employees
         for company_data in scenario_data.get("companies", []):
-            if company_data["name"] not in entity_map:
-                company_id = self.create_entity("Company", company_data["name"])
-                entity_map[company_data["name"]] = company_id
+            company_name = sys.intern(company_data["name"])
+            company_id = entity_map.get(company_name)
+            if company_id is None:
+                company_id = self.create_entity("Company", company_name)
+                entity_map[company_name] = company_id
                 
                 if company_data.get("industry"):
                     self.create_attribute(company_id, "category", company_data["industry"])
-            else:
-                company_id = entity_map[company_data["name"]]
             
             for employee in company_data.get("employees", []):
-                if employee["name"] not in entity_map:
-                    employee_id = self.create_entity("Person", employee["name"])
-                    entity_map[employee["name"]] = employee_id
-                else:
-                    employee_id = entity_map[employee["name"]]
-                
-                # Add attributes
-                self.create_attribute(employee_id, "title", employee.get("title", "Employee"))
-                for alias in employee.get("aliases", []):
-                    self.create_attribute(employee_id, "nameAlias", alias)
-                
-                # Create employment relationship
+                employee_name = sys.intern(employee["name"])
                 strength = 1.0 if any(title in employee.get("title", "") for title in ["CEO", "CFO", "CTO", "President"]) else 0.9
-                self.create_relationship(
-                    employee_id, company_id, "Employment",
+                # Someone already seen (e.g. an attorney who is also on staff) gets a second employment, not a second node
+                entity_map[employee_name] = self.add_person(
+                    name=employee_name,
+                    title=employee.get("title", "Employee"),
+                    aliases=employee.get("aliases", []),
+                    specialization=None,
+                    employer_id=company_id,
                     strength=strength,
-                    start_date=self.generate_random_date(2018, 2023)
+                    start_date=self.generate_random_date(2018, 2023),
+                    person_id=entity_map.get(employee_name)
                 )
         
         # Create explicit relationships
         for rel_data in scenario_data.get("relationships", []):
-            source_name = rel_data.get("source")
-            target_name = rel_data.get("target")
+            source_id = entity_map.get(rel_data.get("source"))
+            target_id = entity_map.get(rel_data.get("target"))
             
-            if source_name in entity_map and target_name in entity_map:
+            if source_id is not None and target_id is not None:
                 self.create_relationship(
-                    entity_map[source_name],
-                    entity_map[target_name],
+                    source_id,
+                    target_id,
                     rel_data.get("type", "Related"),
                     strength=rel_data.get("strength", 0.8),
                     start_date=rel_data.get("start_date"),
                     end_date=rel_data.get("end_date")
                 )
     
-    def generate_test_scenarios(self, num_scenarios: int = 5) -> None:
+    async def generate_scenario_json(self, scenario_type: str) -> Optional[Dict[str, Any]]:
+        """Generate one scenario as structured data; None if the call failed."""
+        return await self.call_llm(self.generate_scenario_prompt(scenario_type))
+    
+    async def generate_scenarios_batch(self, scenario_types: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Generate scenarios as one Message Batch (cheaper, but may take a while)."""
+        return await self.call_llm_batch([self.generate_scenario_prompt(t) for t in scenario_types])
+    
+    async def generate_test_scenarios(self, num_scenarios: int = 5, use_batch: bool = False) -> None:
         """Generate multiple test scenarios using LLM."""
-        scenario_types = ["law_firm", "corporate_client", "family_business", 
-                         "litigation_matter", "merger_acquisition", "real_estate"]
+        scenario_types = [random.choice(SCENARIO_TYPES) for _ in range(num_scenarios)]
         
-        for i in range(num_scenarios):
-            scenario_type = random.choice(scenario_types)
-            print(f"Generating scenario {i+1}/{num_scenarios}: {scenario_type}")
-            
-            prompt = self.generate_scenario_prompt(scenario_type)
-            response = self.call_llm(prompt)
+        # All scenarios are requested concurrently; results are processed in order afterwards
+        if use_batch:
+            results = await self.generate_scenarios_batch(scenario_types)
+        else:
+            results = await asyncio.gather(*(self.generate_scenario_json(t) for t in scenario_types))
+        
+        for i, (scenario_type, scenario_data) in enumerate(zip(scenario_types, results)):
+            logger.info("Generating scenario %d/%d: %s", i + 1, num_scenarios, scenario_type)
             
-            if response:
-                scenario_data = self.parse_llm_response(response)
+            if scenario_data is not None:
                 self.process_scenario_data(scenario_data)
-                print(f"  - Created {len(scenario_data.get('law_firms', []))} law firms")
-                print(f"  - Created {len(scenario_data.get('companies', []))} companies")
-                print(f"  - Created {len(scenario_data.get('relationships', []))} relationships")
+                logger.info("  - Created %d law firms", len(scenario_data.get("law_firms", [])))
+                logger.info("  - Created %d companies", len(scenario_data.get("companies", [])))
+                logger.info("  - Created %d relationships", len(scenario_data.get("relationships", [])))
     
-    def generate_sql_output(self) -> str:
-        """Generate SQL INSERT statements from the collected data."""
-        sql_parts = []
-        
-        sql_parts.append("-- =============================================")
-        sql_parts.append("-- LLM-Generated Test Data for Law Firm Conflict Checking")
-        sql_parts.append(f"-- Generated on: {datetime.now().isoformat()}")
-        sql_parts.append("-- =============================================")
-        sql_parts.append("")
-        sql_parts.append("BEGIN;")
-        sql_parts.append("")
-        
-        # Generate nodes
-        sql_parts.append("-- Insert nodes (entities)")
-        for entity in self.entities:
-            escaped_name = entity['primary_name'].replace("'", "''")
-            sql_parts.append(
-                f"INSERT INTO nodes (node_id, node_type, primary_name, created_by) VALUES "
-                f"('{entity['node_id']}', '{entity['node_type']}', '{escaped_name}', '{entity['created_by']}');"
-            )
-        sql_parts.append("")
-        
-        # Generate attributes
-        sql_parts.append("-- Insert attributes")
-        for attr in self.attributes:
-            escaped_value = attr['attribute_value'].replace("'", "''")
-            sql_parts.append(
-                f"INSERT INTO attributes (node_id, attribute_type, attribute_value, confidence, source) VALUES "
-                f"('{attr['node_id']}', '{attr['attribute_type']}', '{escaped_value}', {attr['confidence']}, '{attr['source']}');"
+    def insert_statements(self, table: str, columns: str, rows: Iterable[str]) -> Iterator[str]:
+        """Group VALUES tuples into multi-row INSERT statements of up to INSERT_BATCH_SIZE rows."""
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, INSERT_BATCH_SIZE))
+            if not chunk:
+                return
+            yield f"INSERT INTO {table} ({columns}) VALUES\n" + ",\n".join(chunk) + ";\n"
+    
+    def iter_sql_lines(self) -> Iterator[str]:
+        """Yield the SQL output piece by piece, each ending in a newline, so it can be streamed to a file."""
+        node_row = NODE_ROW.format
+        attribute_row = ATTRIBUTE_ROW.format
+        relationship_row = RELATIONSHIP_ROW.format
+        entities, attributes, relationships = self.entities, self.attributes, self.relationships
+        
+        yield "-- =============================================\n"
+        yield "-- LLM-Generated Test Data for Law Firm Conflict Checking\n"
+        yield f"-- Generated on: {datetime.now().isoformat()}\n"
+        yield "-- =============================================\n"
+        yield "\n"
+        yield "BEGIN;\n"
+        yield "\n"
+        
+        # Rows are formatted and chunked on the fly, never collected per table
+        yield "-- Insert nodes (entities)\n"
+        yield from self.insert_statements("nodes", NODE_COLUMNS, (
+            node_row(node_id, node_type, primary_name, created_by)
+            for node_id, node_type, primary_name, created_by in zip(
+                entities["node_id"], entities["node_type"], escape_column(entities["primary_name"]),
+                entities["created_by"]
             )
-        sql_parts.append("")
-        
-        # Generate relationships
-        sql_parts.append("-- Insert relationships")
-        for rel in self.relationships:
-            valid_to = f"'{rel['valid_to']}'" if rel['valid_to'] else "NULL"
-            metadata = f"'{rel['metadata']}'" if rel['metadata'] else "NULL"
-            sql_parts.append(
-                f"INSERT INTO relationships (source_node_id, target_node_id, relationship_type, strength, valid_from, valid_to, metadata) VALUES "
-                f"('{rel['source_node_id']}', '{rel['target_node_id']}', '{rel['relationship_type']}', {rel['strength']}, '{rel['valid_from']}', {valid_to}, {metadata});"
+        ))
+        yield "\n"
+        yield "-- Insert attributes\n"
+        yield from self.insert_statements("attributes", ATTRIBUTE_COLUMNS, (
+            attribute_row(node_id, attribute_type, attribute_value, confidence, source)
+            for node_id, attribute_type, attribute_value, confidence, source in zip(
+                attributes["node_id"], attributes["attribute_type"], escape_column(attributes["attribute_value"]),
+                attributes["confidence"], attributes["source"]
             )
-        sql_parts.append("")
-        
-        sql_parts.append("COMMIT;")
-        sql_parts.append("")
-        sql_parts.append("-- Verification queries")
-        sql_parts.append("SELECT 'Generated entities: ' || COUNT(*) FROM nodes WHERE created_by = 'test_generator';")
-        sql_parts.append("SELECT 'Generated attributes: ' || COUNT(*) FROM attributes WHERE source = 'generated';")
-        sql_parts.append("SELECT 'Generated relationships: ' || COUNT(*) FROM relationships;")
-        
-        return "\n".join(sql_parts)
+        ))
+        yield "\n"
+        yield "-- Insert relationships\n"
+        yield from self.insert_statements("relationships", RELATIONSHIP_COLUMNS, (
+            relationship_row(source_node_id, target_node_id, relationship_type, strength, valid_from,
+                             literal_or_null(valid_to), literal_or_null(metadata))
+            for source_node_id, target_node_id, relationship_type, strength, valid_from, valid_to, metadata
+            in zip(*relationships.values())
+        ))
+        yield "\n"
+        yield "COMMIT;\n"
+        yield "\n"
+        yield "-- Verification queries\n"
+        yield "SELECT 'Generated entities: ' || COUNT(*) FROM nodes WHERE created_by = 'test_generator';\n"
+        yield "SELECT 'Generated attributes: ' || COUNT(*) FROM attributes WHERE source = 'generated';\n"
+        yield "SELECT 'Generated relationships: ' || COUNT(*) FROM relationships;\n"
 
 
 def main():
@@ -446,32 +649,44 @@ def main():
     parser.add_argument("--scenarios", type=int, default=5, help="Number of scenarios to generate")
     parser.add_argument("--output", type=str, default="generated_test_data.sql", help="Output SQL file path")
     parser.add_argument("--api-key", type=str, help="Anthropic API key (or set ANTHROPIC_API_KEY env var)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit requests through the Message Batches API (lower cost, slower turnaround)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always call the API instead of replaying responses stored in {LLM_CACHE_PATH}")
+    parser.add_argument("--cache-seed", type=str, default="",
+                        help="Namespace for cached responses; change it to sample new scenarios reproducibly")
+    
+    parser.add_argument("--log-level", type=str, default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Logging verbosity")
     
     args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(message)s")
     
     try:
-        generator = TestDataGenerator(api_key=args.api_key)
-        
-        print(f"Generating {args.scenarios} test scenarios...")
-        generator.generate_test_scenarios(args.scenarios)
+        generator = TestDataGenerator(api_key=args.api_key,
+                                      cache_path=None if args.no_cache else LLM_CACHE_PATH,
+                                      cache_seed=args.cache_seed)
         
-        print(f"Generated:")
-        print(f"  - {len(generator.entities)} entities")
-        print(f"  - {len(generator.attributes)} attributes")
-        print(f"  - {len(generator.relationships)} relationships")
+        logger.info("Generating %d test scenarios...", args.scenarios)
+        asyncio.run(generator.generate_test_scenarios(args.scenarios, use_batch=args.batch))
         
-        sql_output = generator.generate_sql_output()
+        logger.info("Generated:")
+        logger.info("  - %d entities", len(generator.entities["node_id"]))
+        logger.info("  - %d attributes", len(generator.attributes["node_id"]))
+        logger.info("  - %d relationships", len(generator.relationships["source_node_id"]))
+        logger.info("  - %d uncached / %d cached input tokens", generator.input_tokens, generator.cache_read_tokens)
+        logger.info("  - %d scenarios replayed from the response cache", generator.cache_hits)
         
         # Ensure output directory exists
         os.makedirs(os.path.dirname(args.output) if os.path.dirname(args.output) else '.', exist_ok=True)
         
-        with open(args.output, 'w') as f:
-            f.write(sql_output)
+        with open(args.output, 'w', buffering=1 << 20) as f:
+            f.writelines(generator.iter_sql_lines())
         
-        print(f"SQL output written to: {args.output}")
+        logger.info("SQL output written to: %s", args.output)
         
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 
@@ -5,15 +5,84 @@ Uses AWS RDS Data API to populate tables with test data
 """
 
 import boto3
+import csv
+import io
 import json
 import time
 import sys
 from typing import Dict, List, Any
 
+# Fixed statements for the test rows. Values are always bound as named parameters (Data API) or
+# streamed through COPY, never interpolated, so every row reuses the same parsed statement.
+INSERT_NODE_SQL = """
+INSERT INTO nodes (node_id, node_type, primary_name, normalized_name)
+VALUES (CAST(:node_id AS uuid), :node_type, :primary_name, normalize_name(:primary_name))
+ON CONFLICT (node_id) DO NOTHING
+"""
+
+INSERT_ATTRIBUTE_SQL = """
+INSERT INTO attributes (node_id, attribute_type, attribute_value, normalized_value)
+VALUES (CAST(:node_id AS uuid), :attribute_type, :attribute_value, normalize_name(:attribute_value))
+ON CONFLICT DO NOTHING
+"""
+
+INSERT_RELATIONSHIP_SQL = """
+INSERT INTO relationships (source_node_id, target_node_id, relationship_type, strength)
+VALUES (CAST(:source_node_id AS uuid), CAST(:target_node_id AS uuid), :relationship_type, :strength)
+ON CONFLICT DO NOTHING
+"""
+
+CREATE_NODES_STAGE_SQL = """
+CREATE TEMP TABLE nodes_stage (
+    node_id UUID, node_type VARCHAR(50), primary_name VARCHAR(255), normalized_name VARCHAR(255)
+) ON COMMIT DROP
+"""
+
+COPY_NODES_STAGE_SQL = "COPY nodes_stage FROM STDIN WITH (FORMAT csv)"
+
+INSERT_NODES_FROM_STAGE_SQL = """
+INSERT INTO nodes (node_id, node_type, primary_name, normalized_name)
+SELECT node_id, node_type, primary_name, normalized_name FROM nodes_stage
+ON CONFLICT (node_id) DO NOTHING
+"""
+
+COPY_ATTRIBUTES_SQL = (
+    "COPY attributes (node_id, attribute_type, attribute_value, normalized_value) FROM STDIN WITH (FORMAT csv)"
+)
+
+COPY_RELATIONSHIPS_SQL = (
+    "COPY relationships (source_node_id, target_node_id, relationship_type, strength) FROM STDIN WITH (FORMAT csv)"
+)
+
+
+def string_param(name: str, value: str) -> Dict[str, Any]:
+    """RDS Data API named string parameter"""
+    return {'name': name, 'value': {'stringValue': value}}
+
+
+def double_param(name: str, value: float) -> Dict[str, Any]:
+    """RDS Data API named double parameter"""
+    return {'name': name, 'value': {'doubleValue': value}}
+
+
+def normalize(value: str) -> str:
+    """Client-side equivalent of the normalize_name() SQL function"""
+    return ' '.join(value.split()).lower()
+
+
+def copy_rows(cursor, sql: str, rows: List[tuple]) -> None:
+    """Stream rows to a COPY ... FROM STDIN (FORMAT csv) statement"""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(sql, buffer)
+
+
 class DatabasePopulator:
     def __init__(self, profile_name: str = 'lexara_super_agent', region: str = 'us-east-1'):
         """Initialize the database populator with AWS credentials"""
         self.session = boto3.Session(profile_name=profile_name)
+        self.region = region
         self.rds_client = self.session.client('rds-data', region_name=region)
         self.cluster_arn = f"arn:aws:rds:us-east-1:492149691043:cluster:dev-six-worker-cluster"
         self.secret_arn = "arn:aws:secretsmanager:us-east-1:492149691043:secret:dev/six-worker/database-fmJYO8"
@@ -40,6 +109,46 @@ class DatabasePopulator:
             print(f"SQL: {sql[:200]}...")
             return None
 
+    def execute_batch_sql(self, sql: str, parameter_sets: List[List[Dict]]) -> Dict[str, Any]:
+        """Execute one SQL statement once per parameter set, in a single RDS Data API call"""
+        try:
+            return self.rds_client.batch_execute_statement(
+                resourceArn=self.cluster_arn,
+                secretArn=self.secret_arn,
+                database=self.database_name,
+                sql=sql,
+                parameterSets=parameter_sets
+            )
+            
+        except Exception as e:
+            print(f"❌ Error executing batch SQL: {e}")
+            print(f"SQL: {sql[:200]}...")
+            return None
+
+    def _pg_conn(self):
+        """Direct psycopg2 connection using the credentials in the database secret, or None if unavailable"""
+        try:
+            import psycopg2
+        except ImportError:
+            print("   ⚠️  psycopg2 not installed, falling back to the RDS Data API")
+            return None
+            
+        try:
+            secrets_client = self.session.client('secretsmanager', region_name=self.region)
+            credentials = json.loads(secrets_client.get_secret_value(SecretId=self.secret_arn)['SecretString'])
+            return psycopg2.connect(
+                host=credentials['host'],
+                database=self.database_name,
+                user=credentials.get('user') or credentials['username'],
+                password=credentials['password'],
+                port=credentials.get('port', 5432),
+                connect_timeout=10
+            )
+            
+        except Exception as e:
+            print(f"   ⚠️  Direct connection unavailable ({e}), falling back to the RDS Data API")
+            return None
+
     def execute_sql_file(self, file_path: str) -> bool:
         """Execute SQL commands from a file"""
         try:
@@ -94,10 +203,6 @@ class DatabasePopulator:
         );
         """
         
-        result = self.execute_sql(schema_sql)
-        if result is None:
-            return False
-            
         # Create relationships table
         relationships_sql = """
         CREATE TABLE IF NOT EXISTS relationships (
@@ -120,10 +225,6 @@ class DatabasePopulator:
         );
         """
         
-        result = self.execute_sql(relationships_sql)
-        if result is None:
-            return False
-            
         # Create attributes table
         attributes_sql = """
         CREATE TABLE IF NOT EXISTS attributes (
@@ -143,7 +244,8 @@ class DatabasePopulator:
         );
         """
         
-        result = self.execute_sql(attributes_sql)
+        # All three tables go in one round-trip; the statements run in order, so the foreign keys resolve
+        result = self.execute_sql(schema_sql + relationships_sql + attributes_sql)
         if result is None:
             return False
             
@@ -163,10 +265,10 @@ class DatabasePopulator:
             "CREATE INDEX IF NOT EXISTS idx_attributes_type_value ON attributes(attribute_type, normalized_value, status);"
         ]
         
-        for sql in indexes_sql:
-            result = self.execute_sql(sql)
-            if result is None:
-                return False
+        # One round-trip for every index
+        result = self.execute_sql("\n".join(indexes_sql))
+        if result is None:
+            return False
                 
         print("✅ Indexes created successfully")
         return True
@@ -220,8 +322,8 @@ class DatabasePopulator:
         print("✅ Helper functions created successfully")
         return True
 
-    def insert_test_entities(self) -> bool:
-        """Insert test entities (people and companies)"""
+    def insert_test_entities(self, cursor=None) -> bool:
+        """Insert test entities (people and companies), via COPY when given a direct-connection cursor"""
         print("👥 Inserting test entities...")
         
         # Law firm entities
@@ -253,22 +355,33 @@ class DatabasePopulator:
             ("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa", "Person", "Kevin Miller"),
         ]
         
-        for node_id, node_type, primary_name in entities:
-            sql = f"""
-            INSERT INTO nodes (node_id, node_type, primary_name, normalized_name) 
-            VALUES ('{node_id}', '{node_type}', '{primary_name}', normalize_name('{primary_name}'))
-            ON CONFLICT (node_id) DO NOTHING;
-            """
-            
-            result = self.execute_sql(sql)
-            if result is None:
-                return False
+        if cursor is not None:
+            # COPY has no ON CONFLICT, so stage the rows and insert from there to keep re-runs idempotent
+            cursor.execute(CREATE_NODES_STAGE_SQL)
+            copy_rows(cursor, COPY_NODES_STAGE_SQL, [
+                (node_id, node_type, primary_name, normalize(primary_name))
+                for node_id, node_type, primary_name in entities
+            ])
+            cursor.execute(INSERT_NODES_FROM_STAGE_SQL)
+            print("✅ Test entities copied successfully")
+            return True
+        
+        parameter_sets = [
+            [string_param('node_id', node_id), string_param('node_type', node_type),
+             string_param('primary_name', primary_name)]
+            for node_id, node_type, primary_name in entities
+        ]
+        
+        # One round-trip for all rows
+        result = self.execute_batch_sql(INSERT_NODE_SQL, parameter_sets)
+        if result is None:
+            return False
                 
         print("✅ Test entities inserted successfully")
         return True
 
-    def insert_test_attributes(self) -> bool:
-        """Insert test attributes (aliases, titles, etc.)"""
+    def insert_test_attributes(self, cursor=None) -> bool:
+        """Insert test attributes (aliases, titles, etc.), via COPY when given a direct-connection cursor"""
         print("🏷️  Inserting test attributes...")
         
         attributes = [
@@ -305,22 +418,30 @@ class DatabasePopulator:
             ("77777777-7777-7777-7777-777777777771", "nameAlias", "A. Brown"),
         ]
         
-        for node_id, attr_type, attr_value in attributes:
-            sql = f"""
-            INSERT INTO attributes (node_id, attribute_type, attribute_value, normalized_value) 
-            VALUES ('{node_id}', '{attr_type}', '{attr_value}', normalize_name('{attr_value}'))
-            ON CONFLICT DO NOTHING;
-            """
-            
-            result = self.execute_sql(sql)
-            if result is None:
-                return False
+        if cursor is not None:
+            copy_rows(
+                cursor,
+                COPY_ATTRIBUTES_SQL,
+                [(node_id, attr_type, attr_value, normalize(attr_value)) for node_id, attr_type, attr_value in attributes]
+            )
+            print("✅ Test attributes copied successfully")
+            return True
+        
+        parameter_sets = [
+            [string_param('node_id', node_id), string_param('attribute_type', attr_type),
+             string_param('attribute_value', attr_value)]
+            for node_id, attr_type, attr_value in attributes
+        ]
+        
+        result = self.execute_batch_sql(INSERT_ATTRIBUTE_SQL, parameter_sets)
+        if result is None:
+            return False
                 
         print("✅ Test attributes inserted successfully")
         return True
 
-    def insert_test_relationships(self) -> bool:
-        """Insert test relationships"""
+    def insert_test_relationships(self, cursor=None) -> bool:
+        """Insert test relationships, via COPY when given a direct-connection cursor"""
         print("🔗 Inserting test relationships...")
         
         relationships = [
@@ -350,20 +471,51 @@ class DatabasePopulator:
             ("aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa", "55555555-5555-5555-5555-555555555551", "Employment", 1.0),
         ]
         
-        for source_id, target_id, rel_type, strength in relationships:
-            sql = f"""
-            INSERT INTO relationships (source_node_id, target_node_id, relationship_type, strength) 
-            VALUES ('{source_id}', '{target_id}', '{rel_type}', {strength})
-            ON CONFLICT DO NOTHING;
-            """
-            
-            result = self.execute_sql(sql)
-            if result is None:
-                return False
+        if cursor is not None:
+            copy_rows(
+                cursor,
+                COPY_RELATIONSHIPS_SQL,
+                relationships
+            )
+            print("✅ Test relationships copied successfully")
+            return True
+        
+        parameter_sets = [
+            [string_param('source_node_id', source_id), string_param('target_node_id', target_id),
+             string_param('relationship_type', rel_type), double_param('strength', strength)]
+            for source_id, target_id, rel_type, strength in relationships
+        ]
+        
+        result = self.execute_batch_sql(INSERT_RELATIONSHIP_SQL, parameter_sets)
+        if result is None:
+            return False
                 
         print("✅ Test relationships inserted successfully")
         return True
 
+    def insert_test_data(self) -> bool:
+        """Insert all test rows: COPY over one direct connection in a single transaction, else batched Data API calls"""
+        conn = self._pg_conn()
+        if conn is None:
+            return (self.insert_test_entities()
+                    and self.insert_test_attributes()
+                    and self.insert_test_relationships())
+            
+        try:
+            # The connection context manager commits on success and rolls back on error
+            with conn, conn.cursor() as cursor:
+                self.insert_test_entities(cursor)
+                self.insert_test_attributes(cursor)
+                self.insert_test_relationships(cursor)
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error copying test data: {e}")
+            return False
+            
+        finally:
+            conn.close()
+
     def verify_data(self) -> bool:
         """Verify that data was inserted correctly"""
         print("🔍 Verifying data insertion...")
@@ -442,9 +594,7 @@ class DatabasePopulator:
             ("Creating schema", self.create_schema),
             ("Creating indexes", self.create_indexes),
             ("Creating helper functions", self.create_helper_functions),
-            ("Inserting test entities", self.insert_test_entities),
-            ("Inserting test attributes", self.insert_test_attributes),
-            ("Inserting test relationships", self.insert_test_relationships),
+            ("Inserting test data", self.insert_test_data),
             ("Verifying data", self.verify_data),
             ("Running test conflict query", self.run_test_conflict_query),
         ]
@@ -6,8 +6,8 @@ across the codebase and prevent typos in relationship types, node types, and cat
 """
 
 from enum import Enum
-from typing import Set, Dict, Tuple, List
-from dataclasses import dataclass
+from typing import Set, Dict, Tuple, List, Optional
+from dataclasses import dataclass, field
 
 
 class NodeType(Enum):
@@ -183,11 +183,7 @@ class RelationshipDefinition:
     description: str
     category: RelationshipCategory
     is_bidirectional: bool
-    conflicts_with: List[RelationshipType] = None
-    
-    def __post_init__(self):
-        if self.conflicts_with is None:
-            self.conflicts_with = []
+    conflicts_with: List[RelationshipType] = field(default_factory=list)
 
 
 class RelationshipRegistry:
@@ -327,7 +323,7 @@ class RelationshipRegistry:
     }
     
     @classmethod
-    def get_definition(cls, relationship_type: RelationshipType) -> RelationshipDefinition:
+    def get_definition(cls, relationship_type: RelationshipType) -> Optional[RelationshipDefinition]:
         """Get the definition for a relationship type"""
         return cls.DEFINITIONS.get(relationship_type)
     
@@ -235,12 +235,8 @@ class DistributedWorker:
                 return None
 
             if response.status_code == 200:
-                job_data = response.json()
-
-                # Execute claim instruction in Aurora
-                self._execute_claim(job_data)
-
-                return job_data
+                # Coordinator claims the job atomically in Aurora
+                return response.json()
 
             logger.error(f"Unexpected response: {response.status_code}")
             return None
@@ -249,30 +245,6 @@ class DistributedWorker:
             logger.error(f"Failed to claim job: {e}")
             return None
 
-    def _execute_claim(self, job_data: Dict[str, Any]):
-        """Execute the claim instruction to update Aurora"""
-        try:
-            claim_sql = job_data['claim_instruction']['sql']
-            claim_params = job_data['claim_instruction']['params']
-
-            # Convert $1, $2 style placeholders to %s for psycopg2
-            import re
-            claim_sql = re.sub(r'\$\d+', '%s', claim_sql)
-
-            # Convert list to tuple for psycopg2
-            if isinstance(claim_params, list):
-                claim_params = tuple(claim_params)
-
-            with self.db_conn.cursor() as cur:
-                cur.execute(claim_sql, claim_params)
-                self.db_conn.commit()
-
-            logger.info(f"✅ Job claimed in Aurora: {job_data['job_id']}")
-        except Exception as e:
-            self.db_conn.rollback()
-            logger.error(f"Failed to execute claim: {e}")
-            raise
-
     def _load_loader_class(self, job_type: str):
         """
         Dynamically load the appropriate loader class for the job type.